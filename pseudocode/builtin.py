@@ -1,6 +1,11 @@
 """Keywords, operators, and errors supported in pseudo-9608.
 """
 
+import operator
+from itertools import product
+from types import MappingProxyType
+from typing import Callable as function, Dict, Tuple
+
 # Errors
 
 class PseudoError(Exception):
@@ -114,7 +119,9 @@ TYPES = LITERAL + ('FILE', 'ARRAY', 'NULL')
 
 NULL = object()
 
-OPERATORS = {
+# Operator symbols are mapped to their functions once, by the scanner;
+# both tables are read-only so nothing can rebind an oper at runtime.
+OPERATORS = MappingProxyType({
     '+': add,
     '-': sub,
     '*': mul,
@@ -129,7 +136,38 @@ OPERATORS = {
     'OR': OR,
     'NOT': NOT,
     '&': concat,
+})
+
+# Type-specialised operators
+# Maps (oper, operand types...) to an equivalent C implementation from
+# the operator module. Unary opers are keyed with one operand type,
+# binary opers with two. The resolver picks one for each Unary/Binary
+# once operand types are known, so the interpreter skips the Python
+# wrappers above on every evaluation.
+_TYPED_OPERATORS: Dict[Tuple, function] = {
+    (NOT, 'BOOLEAN'): operator.not_,
+    (AND, 'BOOLEAN', 'BOOLEAN'): operator.and_,
+    (OR, 'BOOLEAN', 'BOOLEAN'): operator.or_,
+    (eq, 'BOOLEAN', 'BOOLEAN'): operator.eq,
+    (ne, 'BOOLEAN', 'BOOLEAN'): operator.ne,
+    (concat, 'STRING', 'STRING'): operator.concat,
 }
+for rType in NUMERIC:
+    _TYPED_OPERATORS[(sub, rType)] = operator.neg
+for lType, rType in product(NUMERIC, NUMERIC):
+    _TYPED_OPERATORS.update({
+        (add, lType, rType): operator.add,
+        (sub, lType, rType): operator.sub,
+        (mul, lType, rType): operator.mul,
+        (div, lType, rType): operator.truediv,
+        (lt, lType, rType): operator.lt,
+        (lte, lType, rType): operator.le,
+        (gt, lType, rType): operator.gt,
+        (gte, lType, rType): operator.ge,
+        (ne, lType, rType): operator.ne,
+        (eq, lType, rType): operator.eq,
+    })
+TYPED_OPERATORS = MappingProxyType(_TYPED_OPERATORS)
 
 SYM_SINGLE = '()[]:,.&'
 
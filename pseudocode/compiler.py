@@ -0,0 +1,208 @@
+"""compiler
+
+compileExpr(expr: Expr) -> Code
+    Lowers an expression tree into a flat sequence of instructions,
+    to be run on a value stack by the interpreter.
+
+specialise(expr: Expr, evaluate: function) -> function
+    Builds a closure which evaluates expr when called with an
+    environment.
+"""
+
+from typing import Any, Callable as function, List, Tuple
+
+from . import builtin, lang
+
+# Opcodes
+# Each instruction is an opcode paired with a single operand.
+# For OP_UNARY and OP_BINARY, the operand is the Expr's typedOper.
+# For OP_INDEX and OP_STORE_INDEX, the operand is the number of indexes.
+# For OP_NAME_OP_CONST, the operand is a (slot, name, oper, const) tuple;
+# for OP_NAME_OP_NAME, a (slot, name, oper, slot, name) tuple.
+OP_LOAD_CONST = 0  # push operand
+OP_LOAD_NAME = 1  # push value of name; operand is a (slot, name) pair
+OP_UNARY = 2  # pop right, push oper(right)
+OP_BINARY = 3  # pop right, pop left, push oper(left, right)
+OP_INDEX = 4  # pop n indexes, pop array, push array element
+OP_ATTR = 5  # pop object, push value of attribute name
+OP_STORE_NAME = 6  # assign top of stack to slot
+OP_STORE_INDEX = 7  # pop n indexes, pop array, assign top of stack
+OP_STORE_ATTR = 8  # pop object, assign top of stack to attribute name
+OP_CALL = 9  # push return value of operand Call
+# Superinstructions, fusing common Binary patterns into one instruction
+OP_NAME_OP_CONST = 10  # push oper(name, const)
+OP_NAME_OP_NAME = 11  # push oper(name, name)
+
+
+# Code is kept as a flat sequence of (opcode, operand) instructions;
+# iterating over one sequence of pairs is cheaper in CPython than zipping
+# an opcode array with a parallel operand list. Code is built in a list,
+# then frozen into a tuple, which is smaller and faster to iterate.
+Instruction = Tuple[int, Any]
+CodeBuffer = List[Instruction]
+Code = Tuple[Instruction, ...]
+
+
+def nameSlot(expr: lang.GetName) -> lang.TypedValue:
+    """Returns the TypedValue slot that expr's name is bound to.
+    Compiled code and specialised closures keep the slot itself, so
+    that names are never looked up while running. Frame.declare updates
+    a redeclared name's slot in place, so the slot stays valid when a
+    later run in the same Pseudo declares the name again.
+    """
+    return expr.frame.slots[expr.slot]
+
+
+def compileInto(expr: lang.Expr, code: CodeBuffer) -> None:
+    """Appends instructions for evaluating expr to code."""
+    if isinstance(expr, lang.Literal):
+        code.append((OP_LOAD_CONST, expr.value))
+    elif isinstance(expr, lang.GetName):
+        code.append((OP_LOAD_NAME, (nameSlot(expr), str(expr.name))))
+    elif isinstance(expr, lang.Unary):
+        compileInto(expr.right, code)
+        code.append((OP_UNARY, expr.typedOper))
+    elif isinstance(expr, lang.Binary):
+        compileBinary(expr, code)
+    elif isinstance(expr, lang.GetIndex):
+        compileInto(expr.array, code)
+        for index in expr.index:
+            compileInto(index, code)
+        code.append((OP_INDEX, len(expr.index)))
+    elif isinstance(expr, lang.GetAttr):
+        compileInto(expr.object, code)
+        code.append((OP_ATTR, str(expr.name)))
+    elif isinstance(expr, lang.Assign):
+        compileAssign(expr, code)
+    elif isinstance(expr, lang.Call):
+        code.append((OP_CALL, expr))
+    else:
+        raise TypeError(f"Unexpected expr {expr}")
+
+
+def compileBinary(expr: lang.Binary, code: CodeBuffer) -> None:
+    """Appends instructions for a Binary expr to code.
+    Left-nested chains such as a + b + c are walked without recursion,
+    so long chains do not exceed Python's recursion limit.
+    """
+    chain = [expr]
+    while isinstance(chain[-1].left, lang.Binary):
+        chain.append(chain[-1].left)
+    innermost = chain.pop()
+    left, right = innermost.left, innermost.right
+    if isinstance(left, lang.GetName) and isinstance(right, lang.Literal):
+        code.append((OP_NAME_OP_CONST, (
+            nameSlot(left), str(left.name), innermost.typedOper, right.value
+        )))
+    elif isinstance(left, lang.GetName) and isinstance(right, lang.GetName):
+        code.append((OP_NAME_OP_NAME, (
+            nameSlot(left), str(left.name), innermost.typedOper,
+            nameSlot(right), str(right.name),
+        )))
+    else:
+        compileInto(left, code)
+        compileInto(right, code)
+        code.append((OP_BINARY, innermost.typedOper))
+    for binary in reversed(chain):
+        compileInto(binary.right, code)
+        code.append((OP_BINARY, binary.typedOper))
+
+
+def compileAssign(expr: lang.Assign, code: CodeBuffer) -> None:
+    """Appends instructions for an assignment to code.
+    The assigned value is evaluated first, and is left on the stack.
+    """
+    compileInto(expr.expr, code)
+    assignee = expr.assignee
+    if isinstance(assignee, lang.GetName):
+        code.append((OP_STORE_NAME, nameSlot(assignee)))
+    elif isinstance(assignee, lang.GetIndex):
+        compileInto(assignee.array, code)
+        for index in assignee.index:
+            compileInto(index, code)
+        code.append((OP_STORE_INDEX, len(assignee.index)))
+    elif isinstance(assignee, lang.GetAttr):
+        compileInto(assignee.object, code)
+        code.append((OP_STORE_ATTR, str(assignee.name)))
+    else:
+        raise builtin.RuntimeError("Invalid Input assignee",
+                                   token=assignee.token)
+
+
+def compileExpr(expr: lang.Expr) -> Code:
+    """Returns the compiled Code for expr."""
+    code: CodeBuffer = []
+    compileInto(expr, code)
+    return tuple(code)
+
+
+# Specialisation
+# Exprs are turned into chains of closures that each capture what they
+# need from their node, so that calling the root closure evaluates the
+# Expr without dispatching on node types.
+
+Evaluator = function[[lang.Environment], Any]
+
+# Longest left-nested Binary chain that specialise builds closures for
+MAX_CHAIN = 32
+
+
+def specialiseName(expr: lang.GetName) -> Evaluator:
+    slot, name = nameSlot(expr), str(expr.name)
+
+    def getName(env: lang.Environment) -> Any:
+        value = slot.value
+        if value is None:
+            raise ValueError(f"Accessed unassigned variable {name!r}")
+        return value
+    return getName
+
+
+def specialiseNameOpConst(expr: lang.GetName, oper: function,
+                          const: Any) -> Evaluator:
+    # Fused form of specialise(Binary(GetName, oper, Literal)),
+    # the usual shape of a loop condition
+    slot, name = nameSlot(expr), str(expr.name)
+
+    def getNameOpConst(env: lang.Environment) -> Any:
+        value = slot.value
+        if value is None:
+            raise ValueError(f"Accessed unassigned variable {name!r}")
+        return oper(value, const)
+    return getNameOpConst
+
+
+def chainLength(expr: lang.Binary) -> int:
+    """Returns the number of Binary exprs nested on the left of expr,
+    including expr itself.
+    """
+    length = 1
+    while isinstance(expr.left, lang.Binary):
+        expr, length = expr.left, length + 1
+    return length
+
+
+def specialise(expr: lang.Expr, evaluate: function) -> Evaluator:
+    """Returns a closure that evaluates expr in a given environment.
+    Exprs which cannot be specialised are evaluated by calling evaluate
+    on them. Binary chains longer than MAX_CHAIN are not specialised,
+    as calling the nested closures would recurse once per operator.
+    """
+    if isinstance(expr, lang.Literal):
+        value = expr.value
+        return lambda env: value
+    if isinstance(expr, lang.GetName):
+        return specialiseName(expr)
+    if isinstance(expr, lang.Unary):
+        unaryOper = expr.typedOper
+        operand = specialise(expr.right, evaluate)
+        return lambda env: unaryOper(operand(env))
+    if isinstance(expr, lang.Binary) and chainLength(expr) <= MAX_CHAIN:
+        oper = expr.typedOper
+        if (isinstance(expr.left, lang.GetName)
+                and isinstance(expr.right, lang.Literal)):
+            return specialiseNameOpConst(expr.left, oper, expr.right.value)
+        left = specialise(expr.left, evaluate)
+        right = specialise(expr.right, evaluate)
+        return lambda env: oper(left(env), right(env))
+    return lambda env: evaluate(expr, env)
@@ -5,14 +5,31 @@ execute(frame: Frame, statements: list) -> None
 """
 
 from typing import (
+    Any,
     Callable as function,
+    List,
+    Mapping,
     Optional,
     Union,
 )
 from functools import singledispatch
 from dataclasses import dataclass, field
 
-from . import (builtin, lang, system)
+from . import (builtin, compiler, lang, system)
+from .compiler import (
+    OP_LOAD_CONST,
+    OP_LOAD_NAME,
+    OP_UNARY,
+    OP_BINARY,
+    OP_INDEX,
+    OP_ATTR,
+    OP_STORE_NAME,
+    OP_STORE_INDEX,
+    OP_STORE_ATTR,
+    OP_NAME_OP_CONST,
+    OP_NAME_OP_NAME,
+    OP_CALL,
+)
 
 # ----------------------------------------------------------------------
 
@@ -62,13 +79,16 @@ class Interpreter:
     def registerOutputHandler(self, handler: function) -> None:
         """Register handler as the function to use to handle any output
         from the executed statements.
+        The handler is called once for each OUTPUT statement, with the
+        line to be output as a str (without a trailing line break).
         The default handler is Python's print().
         """
         self.outputHandler = handler  # type: ignore
 
     def interpret(self) -> None:
-        executeStmts(self.statements, self.env,
-                     output=self.outputHandler)
+        env = lang.Environment(self.env.frame, self.env.types,
+                               self.outputHandler)
+        executeStmts(self.statements, env)
 
 
 # Evaluators
@@ -88,249 +108,294 @@ def evalLiteral(literal: lang.Literal, env: lang.Environment) -> lang.PyLiteral:
     return literal.value
 
 
-def evalUnary(expr: lang.Unary, env: lang.Environment) -> lang.PyLiteral:
-    rightval = evaluate(expr.right, env)
-    return expr.oper(rightval)
-
-
-def evalBinary(expr: lang.Binary, env: lang.Environment) -> lang.PyLiteral:
-    leftval = evaluate(expr.left, env)
-    rightval = evaluate(expr.right, env)
-    return expr.oper(leftval, rightval)
+def evalCode(code: compiler.Code, env: lang.Environment) -> lang.Value:
+    """Runs compiled code on a value stack, and returns the value left
+    on top of the stack.
+    """
+    stack: List[Any] = []
+    push = stack.append
+    for op, arg in code:
+        if op == OP_LOAD_NAME:
+            slot, name = arg
+            value = slot.value
+            if value is None:
+                raise ValueError(f"Accessed unassigned variable {name!r}")
+            push(value)
+        elif op == OP_LOAD_CONST:
+            push(arg)
+        elif op == OP_NAME_OP_CONST:
+            slot, name, oper, const = arg
+            value = slot.value
+            if value is None:
+                raise ValueError(f"Accessed unassigned variable {name!r}")
+            push(oper(value, const))
+        elif op == OP_NAME_OP_NAME:
+            lslot, lname, oper, rslot, rname = arg
+            leftval, rightval = lslot.value, rslot.value
+            if leftval is None:
+                raise ValueError(f"Accessed unassigned variable {lname!r}")
+            if rightval is None:
+                raise ValueError(f"Accessed unassigned variable {rname!r}")
+            push(oper(leftval, rightval))
+        elif op == OP_BINARY:
+            rightval = stack.pop()
+            stack[-1] = arg(stack[-1], rightval)
+        elif op == OP_UNARY:
+            stack[-1] = arg(stack[-1])
+        elif op == OP_INDEX:
+            index = tuple(stack[-arg:])
+            del stack[-arg:]
+            stack[-1] = stack[-1].getValue(index)
+        elif op == OP_ATTR:
+            stack[-1] = stack[-1].getValue(arg)
+        elif op == OP_STORE_NAME:
+            arg.value = stack[-1]
+        elif op == OP_STORE_INDEX:
+            index = tuple(stack[-arg:])
+            array = stack[-arg - 1]
+            del stack[-arg - 1:]
+            array.setValue(index, stack[-1])
+        elif op == OP_STORE_ATTR:
+            stack.pop().setValue(arg, stack[-1])
+        else:  # OP_CALL
+            push(evalCall(arg, env))
+    return stack[-1]
+
+
+def evalCompiled(expr: lang.Expr, env: lang.Environment) -> lang.Value:
+    """Evaluates expr by running its compiled code.
+    The code is compiled on first evaluation, and cached on expr.
+    """
+    code = expr.code  # type: ignore
+    if code is None:
+        code = expr.code = compiler.compileExpr(expr)  # type: ignore
+    return evalCode(code, env)
 
 
 @singledispatch
-def evalCallable(callable, callargs, env, **kwargs):
+def evalCallable(callable, expr, env):
     """Returns the evaluated value of a Builtin/Callable."""
     raise TypeError(f"{type(callable)} passed in evalCallable")
 
 
-# BUG: callargs can't be typed with lang.Exprs
-# Raises NameError: name 'Expr' is not defined
-# Could be some complex interaction with singledispatch
 @evalCallable.register
-def _(callable: lang.Builtin, callargs, env: lang.Environment,
-      **kwargs) -> lang.PyLiteral:
+def _(callable: lang.Builtin, expr: lang.Call,
+      env: lang.Environment) -> lang.PyLiteral:
     if callable.func is system.EOF:
-        name = evaluate(callargs[0], env)  # type: ignore
-        file = env.frame.getValue(name)
+        name = evaluate(expr.args[0], env)
+        # The file may have been opened outside the caller's frame
+        frame = env.frame.lookup(name)
+        if frame is None:
+            raise builtin.RuntimeError("File not open", expr.args[0].token)
+        file = frame.getValue(name)
         assert isinstance(file, lang.File), "Invalid File"
         return callable.func(file.iohandler)
-    argvals = [evaluate(arg, env) for arg in callargs]
+    argvals = [evaluate(arg, env) for arg in expr.args]
     return callable.func(*argvals)
 
 
-@evalCallable.register
-def _(callable: lang.Procedure, callargs, env: lang.Environment, **kwargs) -> None:
-    # Assign args to param slots
-    for arg, slot in zip(callargs, callable.params):
-        argval = evaluate(arg, env)
-        slot.value = argval
-    executeStmts(callable.stmts, callable.env, **kwargs)
+def callStmts(callable: lang.Subroutine,
+              expr: lang.Call,
+              env: lang.Environment) -> Optional[lang.Assignable]:
+    """Executes the callable's statements, with the args of expr
+    assigned to its params.
+    Local slots are saved before the call and restored after it, so
+    that recursive calls do not clobber the caller's values.
+    The statements run with the caller's output handler.
+    """
+    # Evaluate all args before assigning any; args may use the
+    # caller's values of the same params
+    argvals = [evaluate(arg, env) for arg, _ in expr.bindings]
+    localSlots = callable.localSlots
+    saved = [slot.value for slot, _ in localSlots]
+    for slot, initial in localSlots:
+        if isinstance(initial, lang.Container):
+            initial = initial.copy()
+        slot.value = initial
+    for (_, param), argval in zip(expr.bindings, argvals):
+        param.value = argval
+    try:
+        return executeStmts(callable.stmts,
+                            env.with_frame(callable.env.frame))
+    finally:
+        for (slot, _), value in zip(localSlots, saved):
+            slot.value = value
 
 
 @evalCallable.register
-def _(callable: lang.Function, callargs, env: lang.Environment,
-      **kwargs) -> lang.Assignable:
-    # Assign args to param slots
-    for arg, slot in zip(callargs, callable.params):
-        argval = evaluate(arg, env)
-        slot.value = argval
-    returnVal = executeStmts(callable.stmts, callable.env, **kwargs)
-    assert returnVal, f"None returned from {callable}"
-    return returnVal
-
-
-def evalAssign(expr: lang.Assign, env: lang.Environment) -> lang.Assignable:
-    """Handles assignment of a value to an Object attribute, Array
-    index, or Frame name.
-    """
-    value = evaluate(expr.expr, env)
-    if isinstance(expr.assignee, lang.GetName):
-        frameMap = expr.assignee.frame
-        name = str(expr.assignee.name)
-        frameMap.setValue(name, value)
-    elif isinstance(expr.assignee, lang.GetIndex):
-        array = evaluate(expr.assignee.array, env)
-        index = evalIndex(expr.assignee.index, env)
-        array.setValue(index, value)
-    elif isinstance(expr.assignee, lang.GetAttr):
-        obj = evaluate(expr.assignee.object, env)
-        name = str(expr.assignee.name)
-        obj.setValue(name, value)
-    else:
-        raise builtin.RuntimeError("Invalid Input assignee",
-                                   token=expr.assignee.token)
-    return value
+def _(callable: lang.Procedure, expr: lang.Call,
+      env: lang.Environment) -> None:
+    callStmts(callable, expr, env)
 
 
-@singledispatch
-def evaluate(expr, env, **kwargs):
-    """Dispatcher for Expr evaluators."""
-    raise TypeError(f"Unexpected expr {expr}")
+@evalCallable.register
+def _(callable: lang.Function, expr: lang.Call,
+      env: lang.Environment) -> lang.Assignable:
+    returnVal = callStmts(callable, expr, env)
+    assert returnVal is not None, f"None returned from {callable}"
+    return returnVal
 
 
-@evaluate.register
-def _(expr: lang.Literal, env: lang.Environment, **kw) -> lang.PyLiteral:
-    return evalLiteral(expr, env)
+def evalGetName(
+    expr: lang.GetName, env: lang.Environment
+) -> Union[lang.Assignable, lang.Callable]:
+    value = expr.frame.slots[expr.slot].value
+    if value is None:
+        raise ValueError(f"Accessed unassigned variable {str(expr.name)!r}")
+    # Names hold PyLiterals, Containers, Callables, or Files;
+    # only Files may not be evaluated
+    if isinstance(value, lang.File):
+        raise RuntimeError(f"{value}: Unexpected File")
+    return value  # type: ignore
+
+
+def evalCall(expr: lang.Call,
+             env: lang.Environment) -> Optional[lang.Assignable]:
+    callable = evaluate(expr.callable, env)
+    returnVal = evalCallable(callable, expr, env)
+    return returnVal
 
 
-@evaluate.register
-def _(expr: lang.Unary, env: lang.Environment, **kw) -> lang.PyLiteral:
-    return evalUnary(expr, env)
+# Evaluators are looked up by the exact type of the Expr; the Expr
+# classes used at runtime are all leaf classes, so no MRO walk is
+# needed.
+EVAL_DISPATCH: Mapping[type, function] = {
+    lang.Literal: evalLiteral,
+    lang.Unary: evalCompiled,
+    lang.Binary: evalCompiled,
+    lang.Assign: evalCompiled,
+    lang.GetName: evalGetName,
+    lang.GetIndex: evalCompiled,
+    lang.GetAttr: evalCompiled,
+    lang.Call: evalCall,
+}
 
 
-@evaluate.register
-def _(expr: lang.Binary, env: lang.Environment, **kw) -> lang.PyLiteral:
-    return evalBinary(expr, env)
+def evaluate(expr: lang.Expr, env: lang.Environment) -> Any:
+    """Dispatcher for Expr evaluators."""
+    try:
+        evaluator = EVAL_DISPATCH[type(expr)]
+    except KeyError:
+        raise TypeError(f"Unexpected expr {expr}") from None
+    return evaluator(expr, env)
 
 
-@evaluate.register
-def _(expr: lang.Assign, env: lang.Environment, **kw) -> lang.Assignable:
-    return evalAssign(expr, env)
+# Executors
 
 
-@evaluate.register
-def _(
-    expr: lang.GetName, env: lang.Environment, **kw
-) -> Union[lang.Assignable, lang.Callable]:
-    value = expr.frame.getValue(str(expr.name))
-    # mypy can't type-check Non-Files
-    if (isinstance(value, bool)
-            or isinstance(value, int)
-            or isinstance(value, float)
-            or isinstance(value, str)
-            or isinstance(value, lang.Container)
-            or isinstance(value, lang.Callable)):
-        return value
-    raise RuntimeError(f"{value}: Unexpected File")
-
-
-@evaluate.register
-def _(expr: lang.GetIndex, env: lang.Environment,
-      **kw) -> Union[lang.PyLiteral, lang.Object]:
-    array = evaluate(expr.array, env)
-    indexes = evalIndex(expr.index, env)
-    return array.getValue(indexes)
-
-
-@evaluate.register
-def _(expr: lang.GetAttr, env: lang.Environment,
-      **kw) -> lang.Assignable:
-    obj = evaluate(expr.object, env)
-    return obj.getValue(str(expr.name))
-
-
-@evaluate.register
-def _(expr: lang.Call, env: lang.Environment,
-      **kw) -> Optional[lang.Assignable]:
-    callable = evaluate(expr.callable, env)
-    returnVal = evalCallable(callable, expr.args, callable.env)
-    return returnVal
+def executeStmts(
+        stmts: lang.Stmts, env: lang.Environment) -> Optional[lang.Assignable]:
+    """Execute a list of statements.
+    Executors return None, except for Return stmts (and stmts containing
+    them), so any other value is passed back as the return value.
+    """
+    # Hot loops bind module-level functions to locals, to avoid a
+    # globals lookup on every iteration
+    executeStmt = execute
+    for stmt in stmts:
+        returnVal = executeStmt(stmt, env)
+        if returnVal is not None:
+            return returnVal
+    return None
 
 
-# Executors
+def execReturn(stmt: lang.Return, env: lang.Environment) -> lang.Assignable:
+    """Returns the value of the Return stmt's expr, which executeStmts()
+    passes back to the caller.
+    """
+    return evaluate(stmt.expr, env)
 
 
-def executeStmts(
-        stmts: lang.Stmts, env: lang.Environment,
-        **kwargs) -> Optional[lang.Assignable]:
-    """Execute a list of statements."""
-    for stmt in stmts:
-        if isinstance(stmt, lang.Return):
-            return execReturn(stmt, env, **kwargs)
+def execOutput(stmt: lang.Output, env: lang.Environment) -> None:
+    # Build the whole line first, so output is only called once
+    strs: List[str] = []
+    evaluateExpr, append = evaluate, strs.append
+    for expr in stmt.exprs:
+        value = evaluateExpr(expr, env)
+        if value is True:
+            append('TRUE')
+        elif value is False:
+            append('FALSE')
         else:
-            returnVal = execute(stmt, env, **kwargs)
-            if returnVal:
-                return returnVal
-    return None
+            append(str(value))
+    env.output(''.join(strs))
 
 
-def execReturn(stmt: lang.Return, env: lang.Environment,
-               **kwargs) -> lang.Assignable:
-    """Return statements should be explicitly checked for and the
-    return value passed back. They should not be dispatched through
-    execute().
+def assignValue(assignee: lang.SetExpr, value: lang.Value,
+                env: lang.Environment) -> None:
+    """Assigns value to an Object attribute, Array index, or Frame
+    name.
     """
-    return evaluate(stmt.expr, env, **kwargs)
+    if isinstance(assignee, lang.GetName):
+        assignee.frame.slots[assignee.slot].value = value
+    elif isinstance(assignee, lang.GetIndex):
+        array = evaluate(assignee.array, env)
+        index = evalIndex(assignee.index, env)
+        array.setValue(index, value)
+    elif isinstance(assignee, lang.GetAttr):
+        obj = evaluate(assignee.object, env)
+        name = str(assignee.name)
+        obj.setValue(name, value)
+    else:
+        raise builtin.RuntimeError("Invalid Input assignee",
+                                   token=assignee.token)
 
 
-@singledispatch
-def execute(stmt: lang.Stmt, env: lang.Environment, **kwargs):
-    """Dispatcher for statement executors."""
-    raise TypeError(f"Invalid Stmt {stmt}")
+def execInput(stmt: lang.Input, env: lang.Environment) -> None:
+    assignValue(stmt.key, input(), env)
 
 
-@execute.register
-def _(stmt: lang.Return, env: lang.Environment, **kwargs) -> None:
-    raise TypeError("Return Stmts should not be dispatched from execute()")
+def execCase(stmt: lang.Case,
+             env: lang.Environment) -> Optional[lang.Assignable]:
+    stmts = stmt.jumpTable.get(evaluate(stmt.cond, env))
+    if stmts is not None:
+        return executeStmts(stmts, env)
+    if stmt.fallback:
+        return executeStmts(stmt.fallback, env)
+    return None
 
 
-@execute.register
-def _(stmt: lang.Output, env: lang.Environment, *, output: function,
-      **kwargs) -> None:
-    for expr in stmt.exprs:
-        value = evaluate(expr, env)
-        if type(value) is bool:
-            value = str(value).upper()
-        output(str(value), end='')
-    output('')  # Add \n
-
-
-@execute.register
-def _(stmt: lang.Input, env: lang.Environment, **kwargs) -> None:
-    if isinstance(stmt.key, lang.GetName):
-        stmt.key.frame.setValue(str(stmt.key.name), input())
-    elif isinstance(stmt.key, lang.GetIndex):
-        array = evaluate(stmt.key.array, env)
-        index = evalIndex(stmt.key.index, env)
-        array.setValue(index, input())
-    elif isinstance(stmt.key, lang.GetAttr):
-        obj = evaluate(stmt.key.object, env)
-        name = str(stmt.key.name)
-        obj.setValue(name, input())
-    raise builtin.RuntimeError("Invalid Input assignee",
-                               token=stmt.key.token)
-
-
-@execute.register
-def _(stmt: lang.Conditional, env: lang.Environment,
-      **kwargs) -> Optional[lang.Assignable]:
-    condValue = evaluate(stmt.cond, env)
-    for caseValue, stmts in stmt.cases.items():
-        if evaluate(caseValue, env) == condValue:
-            return executeStmts(stmts, env, **kwargs)
-    else:  # for loop completed normally, i.e. no matching cases
-        if stmt.fallback:
-            return executeStmts(stmt.fallback, env, **kwargs)
+def execIf(stmt: lang.If,
+           env: lang.Environment) -> Optional[lang.Assignable]:
+    if stmt.condFunc is None:
+        stmt.condFunc = compiler.specialise(stmt.cond, evaluate)
+    if stmt.condFunc(env):
+        return executeStmts(stmt.thenStmts, env)
+    if stmt.fallback:
+        return executeStmts(stmt.fallback, env)
     return None
 
 
-@execute.register
-def _(stmt: lang.While, env: lang.Environment,
-      **kwargs) -> Optional[lang.Assignable]:
+def execWhile(stmt: lang.While,
+              env: lang.Environment) -> Optional[lang.Assignable]:
     if stmt.init:
-        evaluate(stmt.init, env, **kwargs)
-    while evaluate(stmt.cond, env) is True:
-        returnVal = executeStmts(stmt.stmts, env, **kwargs)
-        if returnVal:
+        evaluate(stmt.init, env)
+    if stmt.condFunc is None:
+        stmt.condFunc = compiler.specialise(stmt.cond, evaluate)
+    condFunc, stmts, executeBody = stmt.condFunc, stmt.stmts, executeStmts
+    while condFunc(env):
+        returnVal = executeBody(stmts, env)
+        if returnVal is not None:
             return returnVal
     return None
 
 
-@execute.register
-def _(stmt: lang.Repeat, env: lang.Environment,
-      **kwargs) -> Optional[lang.Assignable]:
-    executeStmts(stmt.stmts, env)
-    while evaluate(stmt.cond, env) is False:
-        returnVal = executeStmts(stmt.stmts, env)
-        if returnVal:
+def execRepeat(stmt: lang.Repeat,
+               env: lang.Environment) -> Optional[lang.Assignable]:
+    if stmt.condFunc is None:
+        stmt.condFunc = compiler.specialise(stmt.cond, evaluate)
+    condFunc, stmts, executeBody = stmt.condFunc, stmt.stmts, executeStmts
+    returnVal = executeBody(stmts, env)
+    if returnVal is not None:
+        return returnVal
+    while not condFunc(env):
+        returnVal = executeBody(stmts, env)
+        if returnVal is not None:
             return returnVal
     return None
 
 
-@execute.register
-def _(stmt: lang.OpenFile, env: lang.Environment, **kwargs) -> None:
+def execOpenFile(stmt: lang.OpenFile, env: lang.Environment) -> None:
     filename = evaluate(stmt.filename, env)
     undeclaredElseError(env, filename, "File already opened",
                         token=stmt.filename.token)
@@ -341,8 +406,7 @@ def _(stmt: lang.OpenFile, env: lang.Environment, **kwargs) -> None:
                                  open(filename, stmt.mode[0].lower())))
 
 
-@execute.register
-def _(stmt: lang.ReadFile, env: lang.Environment, **kwargs) -> None:
+def execReadFile(stmt: lang.ReadFile, env: lang.Environment) -> None:
     filename = evaluate(stmt.filename, env)
     declaredElseError(env, filename, "File not open",
                       token=stmt.filename.token)
@@ -351,17 +415,13 @@ def _(stmt: lang.ReadFile, env: lang.Environment, **kwargs) -> None:
     expectTypeElseError(env.frame.getType(filename), 'FILE',
                         token=stmt.filename.token)
     expectTypeElseError(file.mode, 'READ', token=stmt.filename.token)
-    varname = evaluate(stmt.target, env)
-    assert isinstance(varname, str), f"Expected str, got {varname!r}"
-    declaredElseError(env, varname, token=stmt.target.token)
     # TODO: Catch and handle Python file io errors
-    line = file.iohandler.readline().rstrip()
+    line = file.readline().rstrip()
     # TODO: Type conversion
-    env.frame.setValue(varname, line)
+    assignValue(stmt.target, line, env)
 
 
-@execute.register
-def _(stmt: lang.WriteFile, env: lang.Environment, **kwargs) -> None:
+def execWriteFile(stmt: lang.WriteFile, env: lang.Environment) -> None:
     filename = evaluate(stmt.filename, env)
     declaredElseError(env, filename, "File not open",
                       token=stmt.filename.token)
@@ -380,11 +440,10 @@ def _(stmt: lang.WriteFile, env: lang.Environment, **kwargs) -> None:
     if not writedata.endswith('\n'):
         writedata += '\n'
     # TODO: Catch and handle Python file io errors
-    file.iohandler.write(writedata)
+    file.write(writedata)
 
 
-@execute.register
-def _(stmt: lang.CloseFile, env: lang.Environment, **kwargs) -> None:
+def execCloseFile(stmt: lang.CloseFile, env: lang.Environment) -> None:
     filename = evaluate(stmt.filename, env)
     declaredElseError(env, filename, "File not open",
                       token=stmt.filename.token)
@@ -396,32 +455,48 @@ def _(stmt: lang.CloseFile, env: lang.Environment, **kwargs) -> None:
     env.frame.delete(filename)
 
 
-@execute.register
-def _(stmt: lang.CallStmt, env: lang.Environment, **kwargs) -> None:
+def execCallStmt(stmt: lang.CallStmt, env: lang.Environment) -> None:
     callable = evaluate(stmt.expr.callable, env)
-    evalCallable(callable, stmt.expr.args, callable.env, **kwargs)
+    evalCallable(callable, stmt.expr, env)
 
 
-@execute.register
-def _(stmt: lang.AssignStmt, env: lang.Environment, **kwargs) -> None:
-    evaluate(stmt.expr, env, **kwargs)
+def execAssignStmt(stmt: lang.AssignStmt, env: lang.Environment) -> None:
+    # stmt.expr is always an Assign, so its code is run directly
+    evalCompiled(stmt.expr, env)
 
 
-@execute.register
-def _(stmt: lang.DeclareStmt, env: lang.Environment, **kwargs) -> None:
-    pass
-
-
-@execute.register
-def _(stmt: lang.TypeStmt, env: lang.Environment, **kwargs) -> None:
-    pass
-
-
-@execute.register
-def _(stmt: lang.ProcedureStmt, env: lang.Environment, **kwargs) -> None:
-    pass
+def execDeclaration(stmt: lang.Stmt, env: lang.Environment) -> None:
+    """Declarations are carried out by the resolver; there is nothing
+    left to do at runtime.
+    """
 
 
-@execute.register
-def _(stmt: lang.FunctionStmt, env: lang.Environment, **kwargs) -> None:
-    pass
+# Executors are looked up by the exact type of the Stmt.
+EXEC_DISPATCH: Mapping[type, function] = {
+    lang.Return: execReturn,
+    lang.Output: execOutput,
+    lang.Input: execInput,
+    lang.Case: execCase,
+    lang.If: execIf,
+    lang.While: execWhile,
+    lang.Repeat: execRepeat,
+    lang.OpenFile: execOpenFile,
+    lang.ReadFile: execReadFile,
+    lang.WriteFile: execWriteFile,
+    lang.CloseFile: execCloseFile,
+    lang.CallStmt: execCallStmt,
+    lang.AssignStmt: execAssignStmt,
+    lang.DeclareStmt: execDeclaration,
+    lang.TypeStmt: execDeclaration,
+    lang.ProcedureStmt: execDeclaration,
+    lang.FunctionStmt: execDeclaration,
+}
+
+
+def execute(stmt: lang.Stmt,
+            env: lang.Environment) -> Optional[lang.Assignable]:
+    """Dispatcher for statement executors."""
+    executor = EXEC_DISPATCH.get(type(stmt))
+    if executor is None:
+        raise TypeError(f"Invalid Stmt {stmt}")
+    return executor(stmt, env)
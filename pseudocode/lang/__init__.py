@@ -64,6 +64,9 @@ Declares = Sequence["Declare"]
 # Mappings
 CaseMap = MutableMapping["Literal", Stmts]  # for Conditionals
 
+# (slot, initial value) pairs for a Callable's local frame
+LocalSlots = Tuple[Tuple[o.TypedValue, Optional[o.Value]], ...]
+
 # CallTargets resolve to function names
 CallTarget = Union["UnresolvedName", "GetName"]
 
@@ -101,7 +104,7 @@ class Token:
         return f"{lineinfo} {valuestr!r}"
 
 
-@dataclass
+@dataclass(init=False)
 class Environment:
     """Encapsulates the environment in which interpreting pseudocode is carried out.
 
@@ -109,13 +112,26 @@ class Environment:
     --------------------
     - frame: Frame
     - typesys: TypeSystem
+    - output: function
+        handler for OUTPUT statements, print by default
     """
+    __slots__ = ("frame", "types", "output")
     frame: o.Frame
     types: ts.TypeSystem
+    output: function
+
+    def __init__(self,
+                 frame: o.Frame,
+                 types: ts.TypeSystem,
+                 output: function = print) -> None:
+        # A dataclass default for output would clash with __slots__
+        self.frame = frame
+        self.types = types
+        self.output = output
 
     def with_frame(self, frame: Union[o.Frame, ts.ObjectTemplate]) -> "Environment":
         """Returns a new Environment with the new frame."""
-        return type(self)(frame, self.types)
+        return type(self)(frame, self.types, self.output)
 
 
 @dataclass(frozen=True)
@@ -142,6 +158,7 @@ class Callable(o.PseudoValue):
     - params
         A list of parameters used by the callable
     """
+    __slots__ = ()
 
 
 @dataclass
@@ -160,27 +177,37 @@ class Builtin(Callable):
 
 
 @dataclass
-class Function(Callable):
-    """Functions are evaluated to return a value.
+class Subroutine(Callable):
+    """Base class for Function and Procedure.
+
+    Attributes
+    ----------
     - stmts
-      A list of statements the Function executes when called
+        A list of statements the Subroutine executes when called
+    - localSlots
+        (slot, initial value) pairs for slots owned by the local frame,
+        set by the resolver. Their values are saved and restored around
+        each call.
     """
-    __slots__ = ("env", "params", "stmts")
+    __slots__ = ("env", "params", "stmts", "localSlots")
     env: "Environment"
     params: o.Params
     stmts: Stmts
 
+    def __post_init__(self) -> None:
+        self.localSlots: LocalSlots = ()
+
 
 @dataclass
-class Procedure(Callable):
-    """Procedures are called to execute its statements.
-    - stmts
-      A list of statements the Procedure executes when called
-    """
-    __slots__ = ("env", "params", "stmts")
-    env: "Environment"
-    params: o.Params
-    stmts: Stmts
+class Function(Subroutine):
+    """Functions are evaluated to return a value."""
+    __slots__ = ()
+
+
+@dataclass
+class Procedure(Subroutine):
+    """Procedures are called to execute its statements."""
+    __slots__ = ()
 
 
 @dataclass
@@ -198,12 +225,20 @@ class File(o.PseudoValue):
         The mode that the file was opened in
     - iohandler
         An object for accessing the file
+    - readline, write
+        The iohandler's readline() and write() methods
     """
-    __slots__ = ("name", "mode", "iohandler")
+    __slots__ = ("name", "mode", "iohandler", "readline", "write")
     name: t.NameKey
     mode: FileMode
     iohandler: IO
 
+    def __post_init__(self) -> None:
+        # Bound once when the file is opened, so READFILE and WRITEFILE
+        # make a single call per line
+        self.readline: function = self.iohandler.readline
+        self.write: function = self.iohandler.write
+
 
 class Expr:
     """Represents an expression in 9608 pseudocode.
@@ -214,9 +249,19 @@ class Expr:
     Attributes
     ----------
     token: Token
-        Returns the token asociated with the expr
+        Returns the token asociated with the expr. Subclasses store it
+        as an attribute when constructed.
+
+    Some Exprs also keep work done on them, so it is only done once:
+    typedOper: function
+        The oper of a Unary or Binary, specialised for its operand
+        types by the resolver
+    resolvedType: Optional[Type]
+        The Expr's type, set by the resolver
+    code: Optional[Code]
+        The Expr's instructions, compiled on first evaluation
     """
-    __slots__: Iterable[str] = tuple()
+    __slots__ = ()
 
     @property
     def token(self) -> Token:
@@ -228,34 +273,38 @@ class Literal(Expr):
     """A Literal represents any value coming directly from the source
     code.
     """
-    __slots__ = ("type", "value", "token")
+    __slots__ = ("type", "value", "token", "valueHash")
     type: t.Type
     value: o.PyLiteral
     
     token: Token
 
+    def __post_init__(self) -> None:
+        self.valueHash = hash(self.value)
+
     def __hash__(self):
-        return hash(self.value)
+        return self.valueHash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Literal):
             # Allow Python to try other.__eq__(self)
             # See: https://stackoverflow.com/a/54816069
             return NotImplemented
+        if self.valueHash != other.valueHash:
+            return False
         return self.value == other.value
 
 
 @dataclass
 class Declare(Expr):
     """A Declare Expr associates a Name with its declared Type."""
-    __slots__ = ("name", "type", "metadata")
+    __slots__ = ("name", "type", "metadata", "token")
     name: Name
     type: t.Type
     metadata: TypeMetadata
 
-    @property
-    def token(self):
-        return self.name.token
+    def __post_init__(self) -> None:
+        self.token: Token = self.name.token
 
 
 @dataclass
@@ -264,13 +313,13 @@ class Assign(Expr):
     The Expr"s evaluated value should be assigned to the Name/Index
     represented by the assignee.
     """
-    __slots__ = ("assignee", "expr")
+    __slots__ = ("assignee", "expr", "token", "code")
     assignee: "SetExpr"
     expr: "Expr"
 
-    @property
-    def token(self):
-        return self.assignee.token
+    def __post_init__(self) -> None:
+        self.token: Token = self.assignee.token
+        self.code: Optional[Any] = None
 
 
 @dataclass
@@ -278,23 +327,35 @@ class Unary(Expr):
     """A Unary Expr represents the invocation of a unary callable with a
     single operand.
     """
-    __slots__ = ("oper", "right", "token")
+    __slots__ = ("oper", "right", "token", "typedOper", "resolvedType",
+                 "code")
     oper: function
     right: "Expr"
     token: Token
 
+    def __post_init__(self) -> None:
+        self.typedOper: function = self.oper
+        self.resolvedType: Optional[t.Type] = None
+        self.code: Optional[Any] = None
+
 
 @dataclass
 class Binary(Expr):
     """A Binary Expr represents the invocation of a binary callable
     with two operands.
     """
-    __slots__ = ("left", "oper", "right", "token")
+    __slots__ = ("left", "oper", "right", "token", "typedOper",
+                 "resolvedType", "code")
     left: "Expr"
     oper: function
     right: "Expr"
     token: Token
 
+    def __post_init__(self) -> None:
+        self.typedOper: function = self.oper
+        self.resolvedType: Optional[t.Type] = None
+        self.code: Optional[Any] = None
+
 
 @dataclass
 class UnresolvedName(Expr):
@@ -309,12 +370,11 @@ class UnresolvedName(Expr):
     UnresolvedNames are assumed to be variables or callables; type tokens
     where expected will be parsed to extract the name attribute.
     """
-    __slots__ = ("name", )
+    __slots__ = ("name", "token")
     name: Name
 
-    @property
-    def token(self):
-        return self.name.token
+    def __post_init__(self) -> None:
+        self.token: Token = self.name.token
 
 
 @dataclass
@@ -326,63 +386,74 @@ class SetExpr(Expr):
     
     E.g. Variable evaluation, array indexing, object attribute access
     """
+    __slots__ = ()
 
 
 @dataclass
 class GetName(SetExpr):
-    """A GetName Expr represents a Name with a Frame context."""
-    __slots__ = ("frame", "name")
+    """A GetName Expr represents a Name with a Frame context.
+    slot is the index of the Name's slot in the Frame.
+    """
+    __slots__ = ("frame", "name", "slot", "token")
     frame: o.Frame
     name: Name
+    slot: int
 
-    @property
-    def token(self):
-        return self.name.token
+    def __post_init__(self) -> None:
+        self.token: Token = self.name.token
 
 
 @dataclass
 class GetIndex(SetExpr):
     """A GetName Expr represents a Index with an Array context."""
-    __slots__ = ("array", "index")
+    __slots__ = ("array", "index", "token", "code")
     array: SetExpr
     index: Indices
 
-    @property
-    def token(self):
-        return self.index[0].token
+    def __post_init__(self) -> None:
+        self.token: Token = self.index[0].token
+        self.code: Optional[Any] = None
 
 
 @dataclass
 class GetAttr(SetExpr):
     """A GetName Expr represents a Name with an Object context."""
-    __slots__ = ("object", "name")
+    __slots__ = ("object", "name", "token", "code")
     object: SetExpr
     name: Name
 
-    @property
-    def token(self):
-        return self.name.token
+    def __post_init__(self) -> None:
+        self.token: Token = self.name.token
+        self.code: Optional[Any] = None
 
 
 @dataclass
 class Call(Expr):
     """A Call Expr represents the invocation of a Callable with arguments.
     """
-    __slots__ = ("callable", "args")
+    __slots__ = ("callable", "args", "token", "bindings", "resolvedType")
     callable: CallTarget
     args: Args
 
-    @property
-    def token(self):
-        return self.callable.token
+    def __post_init__(self) -> None:
+        self.token: Token = self.callable.token
+        self.resolvedType: Optional[t.Type] = None
+        # (arg, param) pairs, bound by the resolver for Procedures and
+        # Functions
+        self.bindings: Tuple[Tuple["Expr", o.TypedValue], ...] = ()
 
 
 class Stmt:
     """Represents a statement in 9608 pseudocode.
     A statement usually has one or more expressions, and represents an
     effect: console output, user input, or frame mutation.
+
+    Ifs and Loops also keep:
+    condFunc: Optional[function]
+        A closure evaluating the condition, specialised on first
+        execution
     """
-    __slots__ = tuple()
+    __slots__ = ()
 
 class ExprStmt(Stmt):
     """Base class for statements that contain only a single Expr."""
@@ -392,24 +463,28 @@ class ExprStmt(Stmt):
 @dataclass
 class Return(ExprStmt):
     """Return encapsulates the value to be returned from a Function."""
+    __slots__ = ()
     expr: "Expr"
 
 
 @dataclass
 class AssignStmt(ExprStmt):
     """AssignStmt encapsulates an Assign Expr."""
+    __slots__ = ()
     expr: "Assign"
 
 
 @dataclass
 class DeclareStmt(ExprStmt):
     """DeclareStmt encapsulates a Declare Expr."""
+    __slots__ = ()
     expr: "Declare"
 
 
 @dataclass
 class CallStmt(ExprStmt):
     """CallStmt encapsulates a Call Expr."""
+    __slots__ = ()
     expr: "Call"
 
 
@@ -444,29 +519,50 @@ class Conditional(Stmt):
 
 @dataclass
 class Case(Conditional):
-    ...
+    """Case is a Conditional whose case values are Literals.
+    Their statements are also kept in jumpTable, keyed by the Literals'
+    values, so a matching case is found with a single lookup.
+    """
+    __slots__ = ("jumpTable", )
+
+    def __post_init__(self) -> None:
+        self.jumpTable: MutableMapping[o.PyLiteral, Stmts] = {
+            caseValue.value: stmts
+            for caseValue, stmts in self.cases.items()
+        }
 
 
 @dataclass
 class If(Conditional):
-    ...
+    """If is a Conditional with a single BOOLEAN case, True, whose
+    statements are also kept as thenStmts.
+    """
+    __slots__ = ("thenStmts", "condFunc")
+
+    def __post_init__(self) -> None:
+        self.thenStmts: Stmts = next(iter(self.cases.values()))
+        self.condFunc: Optional[function] = None
 
 
 class Loop(Stmt):
     """Loop encapsulates statements to be executed repeatedly until its
     cond evaluates to a False value.
     """
-    __slots__ = ("init", "cond", "stmts")
+    __slots__ = ("init", "cond", "stmts", "condFunc")
     init: Optional["Expr"]
     cond: "Expr"
     stmts: Stmts
 
+    def __post_init__(self) -> None:
+        self.condFunc: Optional[function] = None
+
 
 @dataclass
 class While(Loop):
     """While represents a pre-condition Loop, executed only if the cond
     evaluates to True.
     """
+    __slots__ = ()
     init: Optional["Expr"]
     cond: "Expr"
     stmts: Stmts
@@ -477,6 +573,7 @@ class Repeat(Loop):
     """Repeat represents a post-condition Loop, executed at least once,
     and then again only if the cond evaluates to True.
     """
+    __slots__ = ()
     init: None
     cond: "Expr"
     stmts: Stmts
@@ -494,11 +591,11 @@ class ProcFunc(Stmt):
 
 
 class ProcedureStmt(ProcFunc):
-    ...
+    __slots__ = ()
 
 
 class FunctionStmt(ProcFunc):
-    ...
+    __slots__ = ()
 
 
 @dataclass
@@ -511,6 +608,7 @@ class TypeStmt(Stmt):
 
 class FileStmt(Stmt):
     """Base class for Stmts involving Files."""
+    __slots__ = ()
     filename: "Expr"
 
 
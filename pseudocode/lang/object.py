@@ -12,11 +12,13 @@ Frame
     Allows values to be addressed by name
 """
 
-from abc import ABC
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from itertools import product
+from math import prod
 from typing import (
     Iterator,
+    List,
     MutableMapping,
     Optional,
     Sequence,
@@ -43,10 +45,13 @@ PyLiteral = Union[bool, int, float, str]
 Value = Union[PyLiteral, "PseudoValue"]
 
 NameMap = MutableMapping[t.NameKey, "TypedValue"]
-IndexMap = MutableMapping[t.IndexKey, "TypedValue"]
 
 Params = Sequence["TypedValue"]
 
+# Containers with more elements than this are not listed in full by
+# __repr__, so that logging a large Container stays cheap
+REPR_LIMIT = 64
+
 
 @dataclass
 class TypedValue:
@@ -68,6 +73,12 @@ class Frame:
     Existence checks should be carried out (using has()) before using
     the methods here.
 
+    Each name is mapped to an integer index into the Frame's slots.
+    Names can be resolved to their index ahead of time, so that slots
+    can be accessed without looking up the name. Declaring a name
+    again updates its existing slot, so slots which are held on to stay
+    bound to their name.
+
     Methods
     -------
     has(name)
@@ -75,6 +86,8 @@ class Frame:
         otherwise returns False
     declare(name, typedValue)
         associates name with typedValue in the Frame
+    indexOf(name)
+        retrieves the index of the slot associated with the name
     get(name)
         retrieves the slot associated with the name
     getType(name)
@@ -90,10 +103,12 @@ class Frame:
     lookup(name)
         returns the first frame containing the name
     """
-    __slots__ = ("data", "outer")
+    __slots__ = ("data", "slots", "freeSlots", "outer")
 
     def __init__(self, outer: "Frame" = None) -> None:
-        self.data: NameMap = {}
+        self.data: MutableMapping[t.NameKey, int] = {}
+        self.slots: List[TypedValue] = []
+        self.freeSlots: List[int] = []
         self.outer = outer
 
     def __repr__(self) -> str:
@@ -104,34 +119,52 @@ class Frame:
         return name in self.data
 
     def declare(self, name: t.NameKey, typedValue: TypedValue) -> None:
-        self.data[name] = typedValue
+        if name in self.data:
+            slot = self.slots[self.data[name]]
+            slot.type, slot.value = typedValue.type, typedValue.value
+        elif self.freeSlots:
+            index = self.freeSlots.pop()
+            self.data[name] = index
+            self.slots[index] = typedValue
+        else:
+            self.data[name] = len(self.slots)
+            self.slots.append(typedValue)
+
+    def indexOf(self, name: t.NameKey) -> int:
+        return self.data[name]
 
     def get(self, name: t.NameKey) -> TypedValue:
-        return self.data[name]
+        return self.slots[self.data[name]]
 
     def getType(self, name: t.NameKey) -> t.Type:
-        return self.data[name].type
+        return self.slots[self.data[name]].type
 
     def getValue(self, name: t.NameKey) -> Value:
-        returnval = self.data[name].value
+        returnval = self.slots[self.data[name]].value
         if returnval is None:
             raise ValueError(f"Accessed unassigned variable {name!r}")
         return returnval
 
     def set(self, name: t.NameKey, typedValue: TypedValue) -> None:
-        self.data[name] = typedValue
+        if name in self.data:
+            self.slots[self.data[name]] = typedValue
+        else:
+            self.declare(name, typedValue)
 
     def setValue(self, name: t.NameKey, value: Value) -> None:
-        self.data[name].value = value
+        self.slots[self.data[name]].value = value
 
     def delete(self, name: t.NameKey) -> None:
-        del self.data[name]
+        # Indexes of other names must not shift, so the slot is left in
+        # place and reused by the next declared name
+        self.freeSlots.append(self.data.pop(name))
 
     def lookup(self, name: t.NameKey) -> Optional["Frame"]:
-        if self.has(name):
-            return self
-        if self.outer:
-            return self.outer.lookup(name)
+        frame: Optional[Frame] = self
+        while frame is not None:
+            if name in frame.data:
+                return frame
+            frame = frame.outer
         return None
 
 
@@ -141,22 +174,26 @@ class PseudoValue(ABC):
     PseudoValues may be stored in Arrays, Objects, or Callables, wrapped
     in a TypedValue.
     """
+    __slots__ = ()
 
 
 class Container(PseudoValue):
     """Base class for Array and Object.
-    Represents a Container in Pseudo, which maps keys to TypedValues.
-
-    Attributes
-    ----------
-    - data
-        A MutableMapping used to map keys to TypedValues
+    Represents a Container in Pseudo, which maps keys to values.
     """
-    data: MutableMapping
+    __slots__ = ()
+
+    @abstractmethod
+    def copy(self) -> "Container":
+        """Returns a copy of the Container, whose values can be
+        assigned without affecting the original.
+        """
 
 
 class Array(Container):
-    """A Container that maps Index: TypedValue.
+    """A Container that maps Index: Value.
+    Elements all share the Array's elementType, so only their values
+    are stored, in a flat list in row-major order of their indexes.
 
     Attributes
     ----------
@@ -164,14 +201,20 @@ class Array(Container):
         integer representing the number of dimensions of the array
     elementType: Type
         The type of each array element
+    values: list
+        The value of each array element
 
     Methods
     -------
     has(index)
         returns True if the index exists in frame,
         otherwise returns False
+    declare(index, typedValue)
+        sets the initial value of the element at the index
+    copy()
+        returns a copy of the Array, with Container elements copied
     get(index)
-        retrieves the slot associated with the index
+        retrieves a TypedValue for the element at the index
     getType(index)
         retrieves the type information associated with the index
     getValue(index)
@@ -179,15 +222,30 @@ class Array(Container):
     setValue(index, value)
         updates the value associated with the index
     """
-    __slots__ = ("ranges", "data")
+    __slots__ = ("ranges", "elementType", "values", "bases", "lengths",
+                 "strides")
 
     def __init__(self, ranges: t.IndexRanges, type: t.Type) -> None:
         self.ranges = ranges
-        self.data: IndexMap = {}
+        self.elementType = type
+        # Each dimension's start index, length, and the distance between
+        # consecutive indexes of that dimension in values
+        self.bases = tuple(start for start, _ in ranges)
+        self.lengths = tuple(end - start + 1 for start, end in ranges)
+        strides: List[int] = []
+        stride = 1
+        for length in reversed(self.lengths):
+            strides.insert(0, stride)
+            stride *= length
+        self.strides = tuple(strides)
+        self.values: List[Optional[Value]] = [None] * prod(self.lengths)
 
     def __repr__(self) -> str:
+        if len(self.values) > REPR_LIMIT:
+            return f"<Array size={len(self.values)}>: {self.elementType}"
         nameValuePairs = [
-            f"{index}: {self.getValue(index)}" for index in self.data
+            f"{index}: {value}" for index, value in zip(
+                self.rangeProduct(self.ranges), self.values)
         ]
         return f"{{{', '.join(nameValuePairs)}}}: {self.elementType}"
 
@@ -202,6 +260,14 @@ class Array(Container):
         ranges = (range(start, end + 1) for (start, end) in indexes)
         return product(*ranges)
 
+    @staticmethod
+    def rangeLinear(indexes: t.IndexRanges) -> range:
+        """Returns a range over the positions in values of an array with
+        the given (start, end) tuples, in the same order as
+        rangeProduct().
+        """
+        return range(prod(end - start + 1 for (start, end) in indexes))
+
     @property
     def dim(self) -> int:
         """Returns the number of dimensions the array has, as an
@@ -210,35 +276,60 @@ class Array(Container):
         """
         return len(self.ranges)
 
-    @property
-    def elementType(self) -> t.Type:
-        return tuple(self.data.values())[0].type
+    def linear(self, index: t.IndexKey) -> int:
+        """Returns the position of the element at index in values.
+        Raises IndexError if the index is out of range.
+        """
+        if len(index) != len(self.lengths):
+            raise IndexError(f"Invalid index {index!r}")
+        offset = 0
+        for i, base, length, stride in zip(
+                index, self.bases, self.lengths, self.strides):
+            i -= base
+            if not 0 <= i < length:
+                raise IndexError(f"Invalid index {index!r}")
+            offset += i * stride
+        return offset
 
     def has(self, index: t.IndexKey) -> bool:
-        return index in self.data
+        try:
+            self.linear(index)
+        except IndexError:
+            return False
+        return True
 
     def declare(self, index: t.IndexKey, typedValue: TypedValue) -> None:
-        self.data[index] = typedValue
+        self.values[self.linear(index)] = typedValue.value
+
+    def copy(self) -> "Array":
+        array = Array(self.ranges, self.elementType)
+        array.values = [
+            value.copy() if isinstance(value, Container) else value
+            for value in self.values
+        ]
+        return array
 
     def getType(self, index: t.IndexKey) -> t.Type:
-        return self.data[index].type
+        return self.elementType
 
     def getValue(self, index: t.IndexKey) -> Union[PyLiteral, "Object"]:
-        returnval = self.data[index].value
+        returnval = self.values[self.linear(index)]
         if returnval is None:
             raise ValueError(f"Accessed unassigned index {index!r}")
-        assert (isinstance(returnval, bool) or isinstance(returnval, int)
-                or isinstance(returnval, float) or isinstance(returnval, str)
-                or isinstance(returnval,
-                              Object)), f"Unexpected {type(returnval)}"
+        assert isinstance(returnval, (bool, int, float, str, Object)), \
+            f"Unexpected {type(returnval)}"
         return returnval
 
     def get(self, index: t.IndexKey) -> "TypedValue":
-        return self.data[index]
+        """Elements are not stored as TypedValues; the returned
+        TypedValue is a copy, and assigning to it does not update the
+        Array.
+        """
+        return TypedValue(self.elementType, self.values[self.linear(index)])
 
     def setValue(self, index: t.IndexKey, value: Union[PyLiteral,
                                                        "Object"]) -> None:
-        self.data[index].value = value
+        self.values[self.linear(index)] = value
 
 
 class Object(Container):
@@ -246,6 +337,11 @@ class Object(Container):
     Existence checks should be carried out (using has()) before using
     the methods here.
 
+    Attributes
+    ----------
+    - data
+        A MutableMapping used to map names to TypedValues
+
     Methods
     -------
     has(name)
@@ -253,6 +349,8 @@ class Object(Container):
         otherwise returns False
     declare(name, typedValue)
         associates name with typedValue in the Container
+    copy()
+        returns a copy of the Object, with its own TypedValues
     get(name)
         retrieves the slot associated with the name
     getType(name)
@@ -268,7 +366,11 @@ class Object(Container):
         self.data: NameMap = {}
 
     def __repr__(self) -> str:
-        nameTypePairs = [f"{name}: {self.getType(name)}" for name in self.data]
+        if len(self.data) > REPR_LIMIT:
+            return f"<Object size={len(self.data)}>"
+        nameTypePairs = [
+            f"{name}: {slot.type}" for name, slot in self.data.items()
+        ]
         return f"{{{', '.join(nameTypePairs)}}}"
 
     def has(self, name: t.NameKey) -> bool:
@@ -277,6 +379,15 @@ class Object(Container):
     def declare(self, name: t.NameKey, typedValue: TypedValue) -> None:
         self.data[name] = typedValue
 
+    def copy(self) -> "Object":
+        obj = Object()
+        obj.data = {
+            name: TypedValue(slot.type, slot.value.copy() if isinstance(
+                slot.value, Container) else slot.value)
+            for name, slot in self.data.items()
+        }
+        return obj
+
     def getType(self, name: t.NameKey) -> t.Type:
         return self.data[name].type
 
@@ -284,10 +395,8 @@ class Object(Container):
         returnval = self.data[name].value
         if returnval is None:
             raise ValueError(f"Accessed unassigned variable {name!r}")
-        assert (isinstance(returnval, bool) or isinstance(returnval, int)
-                or isinstance(returnval, float)
-                or isinstance(returnval, str) or isinstance(
-                    returnval, Container)), f"Unexpected {type(returnval)}"
+        assert isinstance(returnval, (bool, int, float, str, Container)), \
+            f"Unexpected {type(returnval)}"
         return returnval
 
     def get(self, name: t.NameKey) -> "TypedValue":
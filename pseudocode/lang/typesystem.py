@@ -9,7 +9,7 @@ TypeSystem
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import MutableMapping, Optional
+from typing import List, Mapping, MutableMapping, Optional
 
 from . import (
     types as t,
@@ -26,6 +26,8 @@ class Template(ABC):
     -------
     clone()
     """
+    __slots__ = ()
+
     @abstractmethod
     def clone(self):
         """Returns a copy of what the template represemts"""
@@ -37,18 +39,26 @@ class TypeTemplate(Template):
     A type template can be cloned to create a TypedValue slot
     (in a Frame or Object).
 
+    The Object for a type with an ObjectTemplate is built once, as
+    prototype, and copied for each clone.
+
     Methods
     -------
     clone()
     """
-    __slots__ = ("type", "value")
+    __slots__ = ("type", "value", "prototype")
     type: t.Type
     value: Optional["ObjectTemplate"]
 
+    def __post_init__(self) -> None:
+        self.prototype: Optional[o.Object] = None
+
     def clone(self) -> o.TypedValue:
         """This returns an empty TypedValue of the same type."""
         if isinstance(self.value, ObjectTemplate):
-            return o.TypedValue(self.type, self.value.clone())
+            if self.prototype is None:
+                self.prototype = self.value.clone()
+            return o.TypedValue(self.type, self.prototype.copy())
         return o.TypedValue(self.type, self.value)
 
 
@@ -58,21 +68,32 @@ class ObjectTemplate(Template):
     An object template can be cloned to create an Object
     (in a Frame or nested Object).
 
+    Names and their types are kept in two lists, in order of
+    declaration, with each name's index kept in indexes.
+
     Methods
     -------
     clone()
     """
-    __slots__ = ("types", "data")
+    __slots__ = ("types", "names", "nameTypes", "indexes")
 
     def __init__(self, typesys: "TypeSystem") -> None:
         self.types = typesys
-        self.data: MutableMapping[t.NameKey, t.Type] = {}
+        self.names: List[t.NameKey] = []
+        self.nameTypes: List[t.Type] = []
+        self.indexes: MutableMapping[t.NameKey, int] = {}
 
     def __repr__(self) -> str:
-        return repr(self.data)
+        return repr(dict(zip(self.names, self.nameTypes)))
 
     def declare(self, name: t.NameKey, type: t.Type) -> None:
-        self.data[name] = type
+        index = self.indexes.get(name)
+        if index is None:
+            self.indexes[name] = len(self.names)
+            self.names.append(name)
+            self.nameTypes.append(type)
+        else:
+            self.nameTypes[index] = type
 
     def clone(self) -> o.Object:
         """
@@ -80,8 +101,8 @@ class ObjectTemplate(Template):
         declared.
         """
         obj = o.Object()
-        for name, type in self.data.items():
-            obj.declare(name, type)
+        obj.data = dict(zip(self.names,
+                            map(self.types.cloneType, self.nameTypes)))
         return obj
 
 
@@ -96,13 +117,19 @@ class TypeSystem:
     -------
     has(type)
     declare(type)
+    hasTemplate(type)
     setTemplate(type, template)
+    getAttrTypes(type)
     cloneType(type)
     """
-    __slots__ = ("data", )
+    __slots__ = ("data", "attrTypes")
 
     def __init__(self, *types: t.Type) -> None:
         self.data: MutableMapping[t.Type, TypeTemplate] = {}
+        # Attribute names mapped to their types, for each type with a
+        # template; built when first needed
+        self.attrTypes: MutableMapping[t.Type,
+                                       Mapping[t.NameKey, t.Type]] = {}
         for typeName in types:
             self.declare(typeName)
 
@@ -121,9 +148,30 @@ class TypeSystem:
         """
         self.data[type] = TypeTemplate(type, None)
 
+    def hasTemplate(self, type: t.Type) -> bool:
+        """returns True if the type has a template, i.e. its values are
+        Objects, otherwise returns False.
+        """
+        return self.data[type].value is not None
+
     def setTemplate(self, type: t.Type, template: "ObjectTemplate") -> None:
         """Set the template used to initialise a TypedValue with this type."""
-        self.data[type].value = template
+        typeTemplate = self.data[type]
+        typeTemplate.value = template
+        typeTemplate.prototype = None
+        self.attrTypes.pop(type, None)
+
+    def getAttrTypes(self, type: t.Type) -> Mapping[t.NameKey, t.Type]:
+        """Returns the attribute names of a type with a template, mapped
+        to their types.
+        """
+        attrTypes = self.attrTypes.get(type)
+        if attrTypes is None:
+            template = self.data[type].value
+            assert template is not None, f"{type} has no template"
+            attrTypes = dict(zip(template.names, template.nameTypes))
+            self.attrTypes[type] = attrTypes
+        return attrTypes
 
     def cloneType(self, type: t.Type) -> o.TypedValue:
         """Return a copy of the template for the type."""
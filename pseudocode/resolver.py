@@ -6,12 +6,14 @@ verify(statements: list, frame: Frame) -> None
     in the list of statements
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from functools import singledispatch
-from itertools import product
 from typing import (
+    Callable as function,
     Iterable,
-    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
     Optional,
     Tuple,
     Union,
@@ -36,48 +38,77 @@ def expectTypeElseError(exprtype: lang.Type, *expected: lang.Type,
                                  token)
 
 
-def rangeProduct(indexes: lang.IndexRanges) -> Iterator:
-    """Takes an iterable of (start, end) tuple pairs.
-    Returns an iterator for cartesian product of indexes.
-    """
-    ranges = [range(start, end + 1) for (start, end) in indexes]
-    return product(*ranges)
-
-
 def resolveName(unresolved: lang.UnresolvedName,
                 env: lang.Environment) -> lang.GetName:
     """Resolves GetName for the UnresolvedName."""
-    exprFrame = env.frame.lookup(str(unresolved.name))
+    name = str(unresolved.name)
+    exprFrame = env.frame.lookup(name)
     if exprFrame is None:
         raise builtin.LogicError("Undeclared", unresolved.token)
-    return lang.GetName(exprFrame, unresolved.name)
+    return lang.GetName(exprFrame, unresolved.name, exprFrame.indexOf(name))
+
+
+# Field names of each Expr and Stmt class, collected on first use.
+# Fields rather than __slots__, since subclasses only list their own
+# additional slots
+FIELD_NAMES: MutableMapping[type, Tuple[str, ...]] = {}
 
 
 def resolveNamesInTarget(target: Union[lang.Expr, lang.Stmt],
                          env: lang.Environment) -> None:
-    """Checks the exprOrstmt's slots for UnresolvedName, and replaces
+    """Checks the exprOrstmt's fields for UnresolvedName, and replaces
     them with GetNames.
     """
-    for attr in target.__slots__:
-        expr: lang.Expr = getattr(target, attr)
+    targetClass = type(target)
+    fieldNames = FIELD_NAMES.get(targetClass)
+    if fieldNames is None:
+        fieldNames = tuple(
+            field.name for field in fields(target)  # type: ignore
+        )
+        FIELD_NAMES[targetClass] = fieldNames
+    for fieldName in fieldNames:
+        expr: lang.Expr = getattr(target, fieldName)
         if isinstance(expr, lang.UnresolvedName):
-            setattr(target, attr, resolveName(expr, env))
+            setattr(target, fieldName, resolveName(expr, env))
+
+
+def foldConstant(expr: lang.Expr, exprType: lang.Type) -> lang.Expr:
+    """Takes in a resolved Expr and its type.
+    Returns a Literal of its value if it is a Unary or Binary with only
+    Literal operands, otherwise returns the Expr unchanged.
+    Operands are resolved (and folded) before their Expr, so constant
+    subtrees fold bottom-up into a single Literal.
+    """
+    try:
+        if (isinstance(expr, lang.Unary)
+                and isinstance(expr.right, lang.Literal)):
+            value = expr.typedOper(expr.right.value)
+        elif (isinstance(expr, lang.Binary)
+              and isinstance(expr.left, lang.Literal)
+              and isinstance(expr.right, lang.Literal)):
+            value = expr.typedOper(expr.left.value, expr.right.value)
+        else:
+            return expr
+    except ArithmeticError:
+        # e.g. division by zero; leave it to be raised when executed
+        return expr
+    return lang.Literal(exprType, value, expr.token)
 
 
 def resolveExprs(exprs: lang.Exprs,
                  env: lang.Environment) -> Tuple[lang.Expr, ...]:
     """Resolve an iterable of Exprs.
-    UnresolvedNames are resolved into GetNames.
+    UnresolvedNames are resolved into GetNames, and constant Exprs are
+    folded into Literals.
 
     Return: Tuple[Expr, ...]
     """
-    newexprs: Tuple[lang.Expr, ...] = tuple()
+    newexprs: List[lang.Expr] = []
     for expr in exprs:
         if isinstance(expr, lang.UnresolvedName):
             expr = resolveName(expr, env)
-        resolve(expr, env)
-        newexprs += (expr, )
-    return newexprs
+        newexprs.append(foldConstant(expr, resolve(expr, env)))
+    return tuple(newexprs)
 
 
 def resolveArgsParams(callargs: lang.Args, params: lang.Params,
@@ -121,15 +152,25 @@ def declareByref(declare: lang.Declare, env: lang.Environment) -> None:
 
 def declareByval(declare: lang.Declare, env: lang.Environment) -> None:
     """Declares BYVALUE variable in the given environment's frame."""
-    if (isinstance(env.frame, lang.ObjectTemplate) and declare.type == 'ARRAY'):
-        raise builtin.LogicError("ARRAY in TYPE not supported", declare.token)
     name: lang.NameKey = str(declare.name)
+    if isinstance(env.frame, lang.ObjectTemplate):
+        if declare.type == 'ARRAY':
+            raise builtin.LogicError("ARRAY in TYPE not supported",
+                                     declare.token)
+        if not env.types.has(declare.type):
+            raise builtin.LogicError("Undeclared type", declare.token)
+        # Templates only keep types, so no value is cloned
+        env.frame.declare(name, declare.type)
+        return
     env.frame.declare(name, env.types.cloneType(declare.type))
     if declare.type == 'ARRAY':
-        array = lang.Array(ranges=declare.metadata['size'],
-                           type=declare.metadata['type'])
-        for index in array.rangeProduct(declare.metadata['size']):
-            array.declare(index, env.types.cloneType(declare.metadata['type']))
+        elementType = declare.metadata['type']
+        array = lang.Array(ranges=declare.metadata['size'], type=elementType)
+        # Elements share None as their unassigned value, except for
+        # records, which need an Object each
+        if env.types.hasTemplate(elementType):
+            for i in array.rangeLinear(declare.metadata['size']):
+                array.values[i] = env.types.cloneType(elementType).value
 
         assert isinstance(env.frame, lang.Frame), "Frame expected"
         env.frame.setValue(name, array)
@@ -150,24 +191,13 @@ def resolveProcCall(expr: lang.Call, env: lang.Environment) -> lang.Type:
         raise builtin.LogicError("Not PROCEDURE", token=expr.callable.token)
     expr.args = resolveExprs(expr.args, env)
     resolveArgsParams(expr.args, callable.params, env, token=expr.token)
+    expr.bindings = tuple(zip(expr.args, callable.params))
     return callableType
 
 
-@singledispatch
-def resolve(expr, env, **kw):
-    """Dispatcher for Expr resolvers."""
-    raise TypeError(f"No resolver found for {expr}")
-
-
-@resolve.register
-def _(expr: lang.Literal, env: lang.Environment, **kw) -> lang.Type:
-    return expr.type
-
-
-@resolve.register
-def _(expr: lang.Declare, env: lang.Environment,
-      *,
-      passby: lang.Passby = 'BYVALUE') -> lang.Type:
+def resolveDeclare(expr: lang.Declare, env: lang.Environment,
+                   *,
+                   passby: lang.Passby = 'BYVALUE') -> lang.Type:
     """Declare variable in environment's frame with dispatcher."""
     if passby == 'BYVALUE':
         declareByval(expr, env)
@@ -178,10 +208,12 @@ def _(expr: lang.Declare, env: lang.Environment,
     return expr.type
 
 
-@resolve.register
-def _(expr: lang.Unary, env: lang.Environment, **kw) -> lang.Type:
+def resolveUnary(expr: lang.Unary, env: lang.Environment, **kw) -> lang.Type:
     resolveNamesInTarget(expr, env)
     rType = resolve(expr.right, env)
+    expr.right = foldConstant(expr.right, rType)
+    expr.typedOper = builtin.TYPED_OPERATORS.get((expr.oper, rType),
+                                                 expr.oper)
     if expr.oper is builtin.sub:
         expectTypeElseError(rType, *builtin.NUMERIC, token=expr.right.token)
         return rType
@@ -191,58 +223,113 @@ def _(expr: lang.Unary, env: lang.Environment, **kw) -> lang.Type:
     raise ValueError(f"Unexpected oper {expr.oper}")
 
 
-@resolve.register
-def _(expr: lang.Binary, env: lang.Environment, **kw) -> lang.Type:
+def resolveLogicalOp(expr: lang.Binary, lType: lang.Type,
+                     rType: lang.Type) -> lang.Type:
+    expectTypeElseError(lType, 'BOOLEAN', token=expr.left.token)
+    expectTypeElseError(rType, 'BOOLEAN', token=expr.right.token)
+    return 'BOOLEAN'
+
+
+def resolveEqualityOp(expr: lang.Binary, lType: lang.Type,
+                      rType: lang.Type) -> lang.Type:
+    expectTypeElseError(lType, *builtin.EQUATABLE, token=expr.left.token)
+    expectTypeElseError(rType, *builtin.EQUATABLE, token=expr.right.token)
+    if not ((lType == 'BOOLEAN' and rType == 'BOOLEAN')
+            or (lType in builtin.NUMERIC and rType in builtin.NUMERIC)):
+        raise builtin.LogicError(
+            f"Illegal comparison of {lType} and {rType}",
+            token=expr.token,
+        )
+    return 'BOOLEAN'
+
+
+def resolveComparisonOp(expr: lang.Binary, lType: lang.Type,
+                        rType: lang.Type) -> lang.Type:
+    expectTypeElseError(lType, *builtin.NUMERIC, token=expr.left.token)
+    expectTypeElseError(rType, *builtin.NUMERIC, token=expr.right.token)
+    return 'BOOLEAN'
+
+
+def resolveArithmeticOp(expr: lang.Binary, lType: lang.Type,
+                        rType: lang.Type) -> lang.Type:
+    expectTypeElseError(lType, *builtin.NUMERIC, token=expr.left.token)
+    expectTypeElseError(rType, *builtin.NUMERIC, token=expr.right.token)
+    if ((expr.oper is not builtin.div)
+            and (lType == rType == 'INTEGER')):
+        return 'INTEGER'
+    return 'REAL'
+
+
+def resolveConcatOp(expr: lang.Binary, lType: lang.Type,
+                    rType: lang.Type) -> lang.Type:
+    expectTypeElseError(lType, 'STRING', token=expr.left.token)
+    expectTypeElseError(rType, 'STRING', token=expr.right.token)
+    return 'STRING'
+
+
+# Maps each Binary oper to the rule which checks its operand types and
+# returns its result type
+BINARY_RULES: Mapping[function, function] = {
+    builtin.AND: resolveLogicalOp,
+    builtin.OR: resolveLogicalOp,
+    builtin.ne: resolveEqualityOp,
+    builtin.eq: resolveEqualityOp,
+    builtin.gt: resolveComparisonOp,
+    builtin.gte: resolveComparisonOp,
+    builtin.lt: resolveComparisonOp,
+    builtin.lte: resolveComparisonOp,
+    builtin.add: resolveArithmeticOp,
+    builtin.sub: resolveArithmeticOp,
+    builtin.mul: resolveArithmeticOp,
+    builtin.div: resolveArithmeticOp,
+    builtin.concat: resolveConcatOp,
+}
+
+
+def resolveBinary(expr: lang.Binary,
+                  env: lang.Environment, **kw) -> lang.Type:
+    """Resolves a Binary Expr, and any Binary Exprs down its left side.
+    Chains such as A + B + C + ... are parsed into left-nested Binary
+    Exprs; these are resolved bottom-up in a loop rather than by
+    recursion, so long chains do not exceed Python's recursion limit.
+    """
+    chain = []
+    left = expr.left
+    while type(left) is lang.Binary and left.resolvedType is None:
+        chain.append(left)
+        left = left.left
+    for binary in reversed(chain):
+        binary.resolvedType = resolveBinaryNode(binary, env)
+    return resolveBinaryNode(expr, env)
+
+
+def resolveBinaryNode(expr: lang.Binary, env: lang.Environment) -> lang.Type:
+    """Resolves a Binary Expr whose left operand, if a Binary, is
+    resolved already.
+    """
     resolveNamesInTarget(expr, env)
     lType = resolve(expr.left, env)
     rType = resolve(expr.right, env)
-    if expr.oper in (builtin.AND, builtin.OR):
-        expectTypeElseError(lType, 'BOOLEAN', token=expr.left.token)
-        expectTypeElseError(rType, 'BOOLEAN', token=expr.right.token)
-        return 'BOOLEAN'
-    if expr.oper in (builtin.ne, builtin.eq):
-        expectTypeElseError(lType, *builtin.EQUATABLE, token=expr.left.token)
-        expectTypeElseError(rType, *builtin.EQUATABLE, token=expr.right.token)
-        if not ((lType == 'BOOLEAN' and rType == 'BOOLEAN')
-                or (lType in builtin.NUMERIC and rType in builtin.NUMERIC)):
-            raise builtin.LogicError(
-                f"Illegal comparison of {lType} and {rType}",
-                token=expr.token,
-            )
-        return 'BOOLEAN'
-    if expr.oper in (builtin.gt, builtin.gte, builtin.lt, builtin.lte):
-        expectTypeElseError(lType, *builtin.NUMERIC,
-                            token=expr.left.token)
-        expectTypeElseError(rType, *builtin.NUMERIC,
-                            token=expr.right.token)
-        return 'BOOLEAN'
-    if expr.oper in (builtin.add, builtin.sub, builtin.mul, builtin.div):
-        expectTypeElseError(lType, *builtin.NUMERIC,
-                            token=expr.left.token)
-        expectTypeElseError(rType, *builtin.NUMERIC,
-                            token=expr.right.token)
-        if ((expr.oper is not builtin.div)
-                and (lType == rType == 'INTEGER')):
-            return 'INTEGER'
-        return 'REAL'
-    if expr.oper in (builtin.concat, ):
-        expectTypeElseError(lType, 'STRING', token=expr.left.token)
-        expectTypeElseError(rType, 'STRING', token=expr.right.token)
-        return 'STRING'
-    raise ValueError("No return for Binary")
-
-
-@resolve.register
-def _(expr: lang.Assign, env: lang.Environment, **kw) -> lang.Type:
+    expr.left = foldConstant(expr.left, lType)
+    expr.right = foldConstant(expr.right, rType)
+    expr.typedOper = builtin.TYPED_OPERATORS.get((expr.oper, lType, rType),
+                                                 expr.oper)
+    rule = BINARY_RULES.get(expr.oper)
+    if rule is None:
+        raise ValueError("No return for Binary")
+    return rule(expr, lType, rType)
+
+
+def resolveAssign(expr: lang.Assign, env: lang.Environment, **kw) -> lang.Type:
     resolveNamesInTarget(expr, env)
     assnType = resolve(expr.assignee, env)
     exprType = resolve(expr.expr, env)
     expectTypeElseError(exprType, assnType, token=expr.token)
+    expr.expr = foldConstant(expr.expr, exprType)
     return assnType
 
 
-@resolve.register
-def _(expr: lang.Call, env: lang.Environment, **kw) -> lang.Type:
+def resolveFuncCall(expr: lang.Call, env: lang.Environment, **kw) -> lang.Type:
     """Resolve a function call.
     Statement verification should be done in verifyFunction, not here.
     """
@@ -257,11 +344,12 @@ def _(expr: lang.Call, env: lang.Environment, **kw) -> lang.Type:
         raise builtin.LogicError("Not FUNCTION", token=expr.callable.token)
     expr.args = resolveExprs(expr.args, env)
     resolveArgsParams(expr.args, callable.params, env, token=expr.token)
+    expr.bindings = tuple(zip(expr.args, callable.params))
     return callableType
 
 
-@resolve.register
-def _(expr: lang.GetIndex, env: lang.Environment, **kw) -> lang.Type:
+def resolveIndex(expr: lang.GetIndex,
+                 env: lang.Environment, **kw) -> lang.Type:
     """Resolves a GetIndex Expr to return an array element's type"""
     def intsElseError(env: lang.Environment, *indexes):
         for indexExpr in indexes:
@@ -281,8 +369,7 @@ def _(expr: lang.GetIndex, env: lang.Environment, **kw) -> lang.Type:
     return array.elementType
 
 
-@resolve.register
-def _(expr: lang.GetAttr, env: lang.Environment, **kw) -> lang.Type:
+def resolveAttr(expr: lang.GetAttr, env: lang.Environment, **kw) -> lang.Type:
     """Resolves a GetAttr Expr to return an attribute's type"""
     resolveNamesInTarget(expr, env)
     assert not isinstance(expr.object, lang.UnresolvedName), \
@@ -292,21 +379,56 @@ def _(expr: lang.GetAttr, env: lang.Environment, **kw) -> lang.Type:
     if not env.types.has(objType):
         raise builtin.LogicError("Undeclared type", expr.token)
     # Check attribute existence in object template
-    obj = env.types.cloneType(objType).value
-    assert isinstance(obj, lang.Object), "Invalid Object"
-    if not obj.has(str(expr.name)):
+    assert env.types.hasTemplate(objType), "Invalid Object"
+    attrType = env.types.getAttrTypes(objType).get(str(expr.name))
+    if attrType is None:
         raise builtin.LogicError("Undeclared attribute", expr.token)
-    return obj.getType(str(expr.name))
+    return attrType
 
 
-@resolve.register
-def _(expr: lang.GetName, env: lang.Environment, **kw) -> lang.Type:
+def resolveGetName(expr: lang.GetName,
+                   env: lang.Environment, **kw) -> lang.Type:
     """Returns the type of value that name is mapped to in
     environment's frame.
     """
     return expr.frame.getType(str(expr.name))
 
 
+# Resolvers are looked up by the exact type of the Expr; all resolvable
+# Exprs are leaf classes, so no MRO walk is needed.
+RESOLVE_DISPATCH: Mapping[type, function] = {
+    lang.Declare: resolveDeclare,
+    lang.Unary: resolveUnary,
+    lang.Binary: resolveBinary,
+    lang.Assign: resolveAssign,
+    lang.Call: resolveFuncCall,
+    lang.GetIndex: resolveIndex,
+    lang.GetAttr: resolveAttr,
+    lang.GetName: resolveGetName,
+}
+
+
+# Exprs which keep their resolved type. Args and indexes are resolved
+# again when type-checked, so their subtrees are only walked once.
+MEMOIZED = (lang.Unary, lang.Binary, lang.Call)
+
+
+def resolve(expr: lang.Expr, env: lang.Environment, **kw) -> lang.Type:
+    """Dispatcher for Expr resolvers."""
+    # Literals are the most common leaves, and are resolved here
+    # rather than through RESOLVE_DISPATCH
+    if isinstance(expr, lang.Literal):
+        return expr.type
+    resolver = RESOLVE_DISPATCH.get(type(expr))
+    if resolver is None:
+        raise TypeError(f"No resolver found for {expr}")
+    if isinstance(expr, MEMOIZED):
+        if expr.resolvedType is None:
+            expr.resolvedType = resolver(expr, env, **kw)
+        return expr.resolvedType
+    return resolver(expr, env, **kw)
+
+
 # Verifier helpers
 
 
@@ -315,11 +437,24 @@ def transformDeclares(declares: Iterable[lang.Declare], passby: lang.Passby,
     """Takes in a list of Declares. Returns a tuple of TypedValues.
     Used to declare names in an environment's frame/object.
     """
-    params: Tuple[lang.TypedValue, ...] = tuple()
+    params: List[lang.TypedValue] = []
     for declaration in declares:
         resolve(declaration, env, passby=passby)
-        params += (env.frame.get(str(declaration.name)), )
-    return params
+        params.append(env.frame.get(str(declaration.name)))
+    return tuple(params)
+
+
+def localSlots(frame: lang.Frame, params: lang.Params,
+               passby: lang.Passby) -> lang.LocalSlots:
+    """Returns (slot, initial value) pairs for the slots owned by a
+    Callable's local frame.
+    BYREF params are slots from the outer frame, and are left out.
+    """
+    byref = {id(param) for param in params} if passby == 'BYREF' else set()
+    return tuple(
+        (slot, slot.value) for slot in frame.slots
+        if id(slot) not in byref
+    )
 
 
 @singledispatch
@@ -366,34 +501,30 @@ def verifyStmts(stmts: lang.Stmts, env: lang.Environment,
             if not returnType:
                 raise builtin.LogicError("Unexpected RETURN statement",
                                          token=stmt.expr.token)
-            expectTypeElseError(resolve(stmt.expr, env), returnType,
-                                token=stmt.expr.token)
+            resolveNamesInTarget(stmt, env)
+            exprType = resolve(stmt.expr, env)
+            expectTypeElseError(exprType, returnType, token=stmt.expr.token)
+            stmt.expr = foldConstant(stmt.expr, exprType)
         else:
-            verify(stmt, env, returnType)
+            # Look up the verifier here rather than calling verify(),
+            # which is only needed to report unexpected statements
+            verifier = VERIFY_DISPATCH.get(type(stmt), verify)
+            verifier(stmt, env, returnType)
 
 
-@singledispatch
-def verify(stmt, env, returnType):
-    """Dispatcher for Stmt verifiers."""
-    raise builtin.LogicError("Unexpected statement")
-
-
-@verify.register
-def _(stmt: lang.Output, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyOutput(stmt: lang.Output, env: lang.Environment,
+                 returnType: Optional[lang.Type] = None) -> None:
     stmt.exprs = resolveExprs(stmt.exprs, env)
 
 
-@verify.register
-def _(stmt: lang.Input, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyInput(stmt: lang.Input, env: lang.Environment,
+                returnType: Optional[lang.Type] = None) -> None:
     resolveNamesInTarget(stmt, env)
     resolve(stmt.key, env)
 
 
-@verify.register
-def _(stmt: lang.Case, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyCase(stmt: lang.Case, env: lang.Environment,
+               returnType: Optional[lang.Type] = None) -> None:
     resolveNamesInTarget(stmt, env)
     condType = resolve(stmt.cond, env)
     for caseValue, statements in stmt.cases.items():
@@ -404,32 +535,31 @@ def _(stmt: lang.Case, env: lang.Environment,
         verifyStmts(stmt.fallback, env, returnType)
 
 
-@verify.register
-def _(stmt: lang.If, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyIf(stmt: lang.If, env: lang.Environment,
+             returnType: Optional[lang.Type] = None) -> None:
     resolveNamesInTarget(stmt, env)
     condType = resolve(stmt.cond, env)
     expectTypeElseError(condType, 'BOOLEAN', token=stmt.cond.token)
+    stmt.cond = foldConstant(stmt.cond, condType)
     for statements in stmt.cases.values():
         verifyStmts(statements, env, returnType)
     if stmt.fallback:
         verifyStmts(stmt.fallback, env, returnType)
 
 
-@verify.register
-def _(stmt: lang.Loop, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyLoop(stmt: lang.Loop, env: lang.Environment,
+               returnType: Optional[lang.Type] = None) -> None:
     resolveNamesInTarget(stmt, env)
     if stmt.init:
         resolve(stmt.init, env)
     condType = resolve(stmt.cond, env)
     expectTypeElseError(condType, 'BOOLEAN', token=stmt.cond.token)
+    stmt.cond = foldConstant(stmt.cond, condType)
     verifyStmts(stmt.stmts, env, returnType)
 
 
-@verify.register
-def _(stmt: lang.ProcedureStmt, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyProcedure(stmt: lang.ProcedureStmt, env: lang.Environment,
+                    returnType: Optional[lang.Type] = None) -> None:
     """Declare a Procedure in the given environment's frame."""
     # Assign procedure in frame first, to make recursive calls work
     env.frame.declare(str(stmt.name), env.types.cloneType('NULL'))
@@ -445,11 +575,11 @@ def _(stmt: lang.ProcedureStmt, env: lang.Environment,
     env.frame.setValue(str(stmt.name), proc)
 
     verifyStmts(stmt.stmts, localenv)
+    proc.localSlots = localSlots(local, params, stmt.passby)
 
 
-@verify.register
-def _(stmt: lang.FunctionStmt, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyFunction(stmt: lang.FunctionStmt, env: lang.Environment,
+                   returnType: Optional[lang.Type] = None) -> None:
     """Declare a Function in the given environment's frame."""
     # Assign function in frame first, to make recursive calls work
     env.frame.declare(str(stmt.name), env.types.cloneType(stmt.returnType))
@@ -471,20 +601,33 @@ def _(stmt: lang.FunctionStmt, env: lang.Environment,
             stmt.name.token
         )
     verifyStmts(stmt.stmts, localenv, stmt.returnType)
+    func.localSlots = localSlots(local, params, stmt.passby)
 
 
-@verify.register
-def _(stmt: lang.FileStmt, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyFile(stmt: lang.FileStmt, env: lang.Environment,
+               returnType: Optional[lang.Type] = None) -> None:
     resolveNamesInTarget(stmt, env)
     expectTypeElseError(resolve(stmt.filename, env),
                         'STRING',
                         token=stmt.filename.token)
 
 
-@verify.register
-def _(stmt: lang.TypeStmt, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyReadFile(stmt: lang.ReadFile, env: lang.Environment,
+                   returnType: Optional[lang.Type] = None) -> None:
+    verifyFile(stmt, env)
+    # Names nested in an index or attribute target are not resolved
+    # by resolveNamesInTarget
+    resolve(stmt.target, env)
+
+
+def verifyWriteFile(stmt: lang.WriteFile, env: lang.Environment,
+                    returnType: Optional[lang.Type] = None) -> None:
+    verifyFile(stmt, env)
+    resolve(stmt.data, env)
+
+
+def verifyType(stmt: lang.TypeStmt, env: lang.Environment,
+               returnType: Optional[lang.Type] = None) -> None:
     """Declare a custom Type in the given environment's TypeSystem."""
     env.types.declare(str(stmt.name))
     objTemplate = lang.ObjectTemplate(typesys=env.types)
@@ -494,20 +637,48 @@ def _(stmt: lang.TypeStmt, env: lang.Environment,
     env.types.setTemplate(str(stmt.name), objTemplate)
 
 
-@verify.register
-def _(stmt: lang.CallStmt, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyCallStmt(stmt: lang.CallStmt, env: lang.Environment,
+                   returnType: Optional[lang.Type] = None) -> None:
     resolveProcCall(stmt.expr, env)
 
 
-@verify.register
-def _(stmt: lang.AssignStmt, env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyAssignStmt(stmt: lang.AssignStmt, env: lang.Environment,
+                     returnType: Optional[lang.Type] = None) -> None:
     resolve(stmt.expr, env)
 
 
-@verify.register
-def _(stmt: lang.DeclareStmt,
-      env: lang.Environment,
-      returnType: Optional[lang.Type] = None) -> None:
+def verifyDeclareStmt(stmt: lang.DeclareStmt,
+                      env: lang.Environment,
+                      returnType: Optional[lang.Type] = None) -> None:
     resolve(stmt.expr, env)
+
+
+# Verifiers are looked up by the exact type of the Stmt.
+# Return stmts are verified by verifyStmts().
+VERIFY_DISPATCH: Mapping[type, function] = {
+    lang.Output: verifyOutput,
+    lang.Input: verifyInput,
+    lang.Case: verifyCase,
+    lang.If: verifyIf,
+    lang.While: verifyLoop,
+    lang.Repeat: verifyLoop,
+    lang.ProcedureStmt: verifyProcedure,
+    lang.FunctionStmt: verifyFunction,
+    lang.OpenFile: verifyFile,
+    lang.ReadFile: verifyReadFile,
+    lang.WriteFile: verifyWriteFile,
+    lang.CloseFile: verifyFile,
+    lang.TypeStmt: verifyType,
+    lang.CallStmt: verifyCallStmt,
+    lang.AssignStmt: verifyAssignStmt,
+    lang.DeclareStmt: verifyDeclareStmt,
+}
+
+
+def verify(stmt: lang.Stmt, env: lang.Environment,
+           returnType: Optional[lang.Type] = None) -> None:
+    """Dispatcher for Stmt verifiers."""
+    verifier = VERIFY_DISPATCH.get(type(stmt))
+    if verifier is None:
+        raise builtin.LogicError("Unexpected statement", token=None)
+    verifier(stmt, env, returnType)
@@ -4,6 +4,7 @@ scan(src: str) -> tokens: list, lines: list
     Scans src string, returns a list of tokens and a list of code lines.
 """
 
+from sys import intern
 from typing import Any, Union
 from typing import List, Tuple
 
@@ -34,7 +35,10 @@ def makeToken(code: "Code", type: lang.Type, word: str,
     """Factory function for a Token."""
     # First char is column 1
     column = code.cursor - code.lineStart - len(word) + 1
-    return lang.Token(code.line, column, type, word, value)
+    # Words are built up char by char, so each token would otherwise
+    # hold its own copy. Interning shares one string per distinct word,
+    # and names used as Frame keys then compare by identity.
+    return lang.Token(code.line, column, type, intern(word), value)
 
 
 def islinebreak(token: Union[lang.Token, str]) -> bool:
@@ -0,0 +1,43 @@
+import unittest
+
+import pseudocode
+from tests import capture
+
+TESTCODE = """
+DECLARE Grid : ARRAY[0:2, 3:5] OF INTEGER
+DECLARE Row : INTEGER
+DECLARE Col : INTEGER
+
+FOR Row <- 0 TO 2
+    FOR Col <- 3 TO 5
+        Grid[Row, Col] <- Row * 10 + Col
+    ENDFOR
+ENDFOR
+FOR Row <- 0 TO 2
+    FOR Col <- 3 TO 5
+        OUTPUT Grid[Row, Col]
+    ENDFOR
+ENDFOR
+"""
+
+class ArrayBoundsTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_array_bounds(self):
+        # Program should complete successfully
+        self.assertIsNone(self.result['error'])
+
+    def test_output(self):
+        # Each index should map to its own element
+        output = self.result['output']
+        expected = [
+            str(row * 10 + col) for row in range(0, 3) for col in range(3, 6)
+        ]
+        self.assertEqual(output.split(), expected)
@@ -0,0 +1,33 @@
+import unittest
+
+import pseudocode
+from tests import capture
+
+TESTCODE = """
+DECLARE Total : INTEGER
+Total <- 1 + 2 * 3
+OUTPUT Total, " ", -5 + 1, " ", "a" & "b", " ", 7 / 2
+IF 1 < 2 AND NOT FALSE
+  THEN
+    OUTPUT "folded"
+ENDIF
+"""
+
+class ConstantFoldingTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_constants(self):
+        # Program should complete successfully
+        self.assertIsNone(self.result['error'])
+
+    def test_output(self):
+        # Folded expressions should give the same values as evaluated ones
+        output = self.result['output']
+        self.assertEqual(output, "7 -4 ab 3.5\nfolded\n")
@@ -0,0 +1,44 @@
+import unittest
+
+import os
+
+import pseudocode
+from tests import capture
+
+TESTFILE = "testfile_eof.txt"
+
+TESTCODE = (
+    'PROCEDURE ShowEOF(Unused : INTEGER)\n'
+    f'    OUTPUT EOF("{TESTFILE}")\n'
+    'ENDPROCEDURE\n'
+    f'OPENFILE "{TESTFILE}" FOR READ\n'
+    'CALL ShowEOF(0)\n'
+    f'CLOSEFILE "{TESTFILE}"\n'
+    'CALL ShowEOF(0)\n'
+)
+
+class EOFProcedureTestCase(unittest.TestCase):
+    def setUp(self):
+        with open(TESTFILE, "w") as file:
+            file.write("line\n")
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_error(self):
+        # EOF on a closed file should raise a RuntimeError
+        error = self.result['error']
+        self.assertIsInstance(error, pseudocode.builtin.RuntimeError)
+        self.assertEqual(error.msg(), "File not open")
+
+    def test_output(self):
+        # EOF should find files opened outside the procedure
+        output = self.result['output']
+        self.assertEqual(output.strip(), 'FALSE')
+
+    def tearDown(self):
+        os.remove(TESTFILE)
@@ -0,0 +1,50 @@
+import unittest
+
+import os
+
+import pseudocode
+from tests import capture
+
+TESTFILE = "testfile_read_target.txt"
+
+TESTCODE = (
+    'DECLARE Lines : ARRAY[1:2] OF STRING\n'
+    'TYPE Entry\n'
+    '    DECLARE Text : STRING\n'
+    'ENDTYPE\n'
+    'DECLARE Last : Entry\n'
+    'Lines[2] <- "second"\n'
+    f'OPENFILE "{TESTFILE}" FOR WRITE\n'
+    f'WRITEFILE "{TESTFILE}", "first"\n'
+    f'WRITEFILE "{TESTFILE}", Lines[2]\n'
+    f'CLOSEFILE "{TESTFILE}"\n'
+    f'OPENFILE "{TESTFILE}" FOR READ\n'
+    f'READFILE "{TESTFILE}", Lines[1]\n'
+    f'READFILE "{TESTFILE}", Last.Text\n'
+    f'CLOSEFILE "{TESTFILE}"\n'
+    'OUTPUT Lines[1]\n'
+    'OUTPUT Last.Text\n'
+)
+
+class FileReadTargetTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_file(self):
+        # File operations should complete successfully
+        self.assertIsNone(self.result['error'])
+
+    def test_output(self):
+        # Lines should be read into array elements and attributes
+        output = self.result['output']
+        self.assertEqual(output, "first\nsecond\n")
+
+    def tearDown(self):
+        if os.path.exists(TESTFILE):
+            os.remove(TESTFILE)
@@ -0,0 +1,45 @@
+import unittest
+
+import os
+
+import pseudocode
+from tests import capture
+
+TESTFILE = "testfile_readwrite.txt"
+
+TESTCODE = (
+    'DECLARE Line : STRING\n'
+    f'OPENFILE "{TESTFILE}" FOR WRITE\n'
+    f'WRITEFILE "{TESTFILE}", "first"\n'
+    f'WRITEFILE "{TESTFILE}", TRUE\n'
+    f'CLOSEFILE "{TESTFILE}"\n'
+    f'OPENFILE "{TESTFILE}" FOR READ\n'
+    f'READFILE "{TESTFILE}", Line\n'
+    'OUTPUT Line\n'
+    f'READFILE "{TESTFILE}", Line\n'
+    'OUTPUT Line\n'
+    f'CLOSEFILE "{TESTFILE}"'
+)
+
+class FileReadWriteTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_file(self):
+        # File operations should complete successfully
+        self.assertIsNone(self.result['error'])
+
+    def test_output(self):
+        # Check output
+        output = self.result['output']
+        self.assertEqual(output, "first\nTRUE\n")
+
+    def tearDown(self):
+        if os.path.exists(TESTFILE):
+            os.remove(TESTFILE)
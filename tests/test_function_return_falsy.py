@@ -0,0 +1,60 @@
+import unittest
+
+import pseudocode
+from tests import capture
+
+TESTCODE = """
+FUNCTION Zero(Num : INTEGER) RETURNS INTEGER
+    CASE OF Num
+      5: RETURN 0
+      OTHERWISE RETURN 1
+    ENDCASE
+ENDFUNCTION
+
+FUNCTION Negate(Flag : BOOLEAN) RETURNS BOOLEAN
+    CASE OF Flag
+      TRUE: RETURN FALSE
+      OTHERWISE RETURN TRUE
+    ENDCASE
+ENDFUNCTION
+
+FUNCTION Blank(Text : STRING) RETURNS STRING
+    CASE OF Text
+      "a": RETURN ""
+      OTHERWISE RETURN "b"
+    ENDCASE
+ENDFUNCTION
+
+FUNCTION FirstOf(Start : INTEGER) RETURNS INTEGER
+    DECLARE Count : INTEGER
+    Count <- Start
+    REPEAT
+        CASE OF Count
+          3: RETURN 30
+          OTHERWISE RETURN 0
+        ENDCASE
+        Count <- Count + 1
+    UNTIL Count > 10
+ENDFUNCTION
+
+OUTPUT Zero(5), " ", Negate(TRUE), " [", Blank("a"), "] ", FirstOf(3)
+"""
+
+class FunctionReturnFalsyTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_return(self):
+        # Falsy return values should not be mistaken for missing returns
+        self.assertIsNone(self.result['error'])
+
+    def test_output(self):
+        # RETURN in a REPEAT body should return on the first iteration
+        output = self.result['output']
+        self.assertEqual(output, "0 FALSE [] 30\n")
@@ -0,0 +1,34 @@
+import unittest
+from unittest.mock import patch
+
+import pseudocode
+from tests import capture
+
+TESTCODE = """
+DECLARE Name : STRING
+INPUT Name
+OUTPUT "Hello, " & Name
+"""
+
+class InputTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        with patch('builtins.input', return_value="World"):
+            self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_input(self):
+        # Input should complete successfully
+        self.assertIsNone(self.result['error'])
+
+        frame = self.result['env'].frame
+        self.assertEqual(frame.getValue('Name'), "World")
+
+    def test_output(self):
+        # Check output
+        output = self.result['output']
+        self.assertEqual(output, "Hello, World\n")
@@ -0,0 +1,36 @@
+import unittest
+
+import pseudocode
+from tests import capture
+
+TERMS = " + ".join(["x"] * 2000)
+
+TESTCODE = f"""
+DECLARE x : INTEGER
+DECLARE Total : INTEGER
+x <- 1
+Total <- {TERMS}
+OUTPUT Total
+WHILE Total < {TERMS} + 2 DO
+  Total <- Total + 1
+ENDWHILE
+OUTPUT Total
+"""
+
+class LongExpressionTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_long_expression(self):
+        # Long chains should not exceed the recursion limit
+        self.assertIsNone(self.result['error'])
+
+    def test_output(self):
+        output = self.result['output']
+        self.assertEqual(output, "2000\n2002\n")
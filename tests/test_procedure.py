@@ -45,8 +45,9 @@ class ProcedureTestCase(unittest.TestCase):
         procedure = frame.getValue('TestBool')
 
         # Check procedure params
+        # Param values are restored after the call
         self.assertTrue(
-            procedure.env.frame.getValue('Succeeded')
+            procedure.env.frame.has('Succeeded')
         )
         self.assertEqual(
             procedure.env.frame.getType('Succeeded'),
@@ -0,0 +1,38 @@
+import unittest
+
+import pseudocode
+from tests import capture
+
+TESTCODE = """
+TYPE Point
+    DECLARE X : INTEGER
+    DECLARE Y : INTEGER
+ENDTYPE
+DECLARE P : Point
+DECLARE Q : Point
+DECLARE Points : ARRAY[1:2] OF Point
+P.X <- 1
+Q.X <- 2
+Points[1].Y <- 3
+Points[2].Y <- 4
+OUTPUT P.X, Q.X, Points[1].Y, Points[2].Y
+"""
+
+class RecordArrayTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_records(self):
+        # Program should complete successfully
+        self.assertIsNone(self.result['error'])
+
+    def test_output(self):
+        # Each record should have its own attributes
+        output = self.result['output']
+        self.assertEqual(output.strip(), "1234")
@@ -0,0 +1,36 @@
+import unittest
+
+import pseudocode
+from tests import capture
+
+TESTCODE = """
+FUNCTION Fib(Num : INTEGER) RETURNS INTEGER
+    DECLARE Small : BOOLEAN
+    Small <- Num < 2
+    CASE OF Small
+      TRUE: RETURN Num
+      OTHERWISE RETURN Fib(Num - 1) + Fib(Num - 2)
+    ENDCASE
+ENDFUNCTION
+
+OUTPUT Fib(10)
+"""
+
+class RecursionFunctionTestCase(unittest.TestCase):
+    def setUp(self):
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.result = pseudo.run(TESTCODE)
+        self.result['output'] = returnOutput()
+
+    def test_recursion(self):
+        # Function should complete successfully
+        self.assertIsNone(self.result['error'])
+
+    def test_output(self):
+        # Each call should keep its own Num and Small
+        output = self.result['output']
+        self.assertEqual(output.strip(), "55")
@@ -0,0 +1,52 @@
+import unittest
+
+import pseudocode
+from tests import capture
+
+FIRSTCODE = """
+DECLARE Base : INTEGER
+DECLARE Total : INTEGER
+DECLARE Count : INTEGER
+Base <- 1
+PROCEDURE Update(Step : INTEGER)
+    OUTPUT Base + 1
+    Total <- Total + Step
+    Count <- 0
+    WHILE Count < 3 DO
+        Count <- Count + 1
+    ENDWHILE
+ENDPROCEDURE
+Total <- 0
+CALL Update(1)
+"""
+
+SECONDCODE = """
+DECLARE Base : INTEGER
+DECLARE Total : INTEGER
+DECLARE Count : INTEGER
+Base <- 10
+Total <- 100
+CALL Update(1)
+OUTPUT Total, " ", Count
+"""
+
+class ReplRedeclareTestCase(unittest.TestCase):
+    def setUp(self):
+        # Both sources run in the same Pseudo, as in REPL mode
+        pseudo = pseudocode.Pseudo()
+        captureOutput, returnOutput = capture('output')
+        pseudo.registerHandlers(
+            output=captureOutput,
+        )
+        self.first = pseudo.run(FIRSTCODE)
+        self.second = pseudo.run(SECONDCODE)
+        self.output = returnOutput()
+
+    def test_redeclare(self):
+        # Program should complete successfully
+        self.assertIsNone(self.first['error'])
+        self.assertIsNone(self.second['error'])
+
+    def test_output(self):
+        # The procedure should use the redeclared globals
+        self.assertEqual(self.output, "2\n11\n101 3\n")